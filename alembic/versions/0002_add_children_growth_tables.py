@@ -52,11 +52,16 @@ def upgrade() -> None:
         sa.Column('weight_kg', sa.Float(), nullable=False),
         sa.Column('height_cm', sa.Float(), nullable=False),
         sa.Column('muac_cm', sa.Float(), nullable=True),
-        sa.Column('bmi', sa.Float(), nullable=True),
+        # Computed by the engine at INSERT time; stays consistent with the
+        # measurements without a per-row Python calculation
+        sa.Column('bmi', sa.Float(),
+                  sa.Computed('weight_kg / ((height_cm/100.0) * (height_cm/100.0))',
+                              persisted=True),
+                  nullable=True),
         sa.Column('diet_diversity_score', sa.Integer(), nullable=False),
         sa.Column('recent_infection', sa.Boolean(), nullable=False),
-        sa.Column('z_scores_percentiles', postgresql.JSON(astext_type=sa.Text()), nullable=True),
-        sa.Column('prediction_results', postgresql.JSON(astext_type=sa.Text()), nullable=True),
+        sa.Column('z_scores_percentiles', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column('prediction_results', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
         sa.Column('recorded_at', sa.DateTime(), nullable=False),
         sa.ForeignKeyConstraint(['child_id'], ['children.child_id'], ),
         sa.PrimaryKeyConstraint('record_id')
@@ -64,10 +69,14 @@ def upgrade() -> None:
     op.create_index(op.f('ix_growth_records_child_id'), 'growth_records', ['child_id'], unique=False)
     op.create_index('idx_growth_records_age', 'growth_records', ['age_months'], unique=False)
     op.create_index('idx_growth_records_child_recorded', 'growth_records', ['child_id', 'recorded_at'], unique=False)
+    # GIN index for containment/key lookups on prediction results
+    op.create_index('idx_growth_predictions_gin', 'growth_records', ['prediction_results'],
+                    unique=False, postgresql_using='gin')
 
 
 def downgrade() -> None:
     # Drop indexes
+    op.drop_index('idx_growth_predictions_gin', 'growth_records')
     op.drop_index('idx_growth_records_child_recorded', 'growth_records')
     op.drop_index('idx_growth_records_age', 'growth_records')
     op.drop_index(op.f('ix_growth_records_child_id'), 'growth_records')
@@ -0,0 +1,31 @@
+"""Add covering index for the children listing query
+
+Revision ID: 0003_children_parent_covering
+Revises: a442250753cc
+Create Date: 2026-08-27 10:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '0003_children_parent_covering'
+down_revision = 'a442250753cc'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Covering index so get_children_by_parent can be answered from the
+    # index alone (index-only scan) without heap fetches; replaces the
+    # plain parent_id index to avoid maintaining both
+    op.create_index(
+        'ix_children_parent_covering', 'children', ['parent_id'],
+        unique=False,
+        postgresql_include=['child_id', 'name', 'sex', 'birth_date', 'created_at']
+    )
+    op.drop_index(op.f('ix_children_parent_id'), table_name='children')
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_children_parent_id'), 'children', ['parent_id'], unique=False)
+    op.drop_index('ix_children_parent_covering', table_name='children')
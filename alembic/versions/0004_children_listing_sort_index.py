@@ -0,0 +1,37 @@
+"""Key the children covering index on (parent_id, created_at DESC)
+
+Revision ID: 0004_children_listing_sort
+Revises: 0003_children_parent_covering
+Create Date: 2026-08-27 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '0004_children_listing_sort'
+down_revision = '0003_children_parent_covering'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # get_children_by_parent filters on parent_id and sorts on
+    # created_at DESC; keying the index on both lets the rows come back
+    # already sorted, while the INCLUDE columns keep it an index-only scan
+    op.drop_index('ix_children_parent_covering', table_name='children')
+    op.create_index(
+        'ix_children_parent_created', 'children',
+        ['parent_id', sa.text('created_at DESC')],
+        unique=False,
+        postgresql_include=['child_id', 'name', 'sex', 'birth_date']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_children_parent_created', table_name='children')
+    op.create_index(
+        'ix_children_parent_covering', 'children', ['parent_id'],
+        unique=False,
+        postgresql_include=['child_id', 'name', 'sex', 'birth_date', 'created_at']
+    )
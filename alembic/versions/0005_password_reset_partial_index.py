@@ -0,0 +1,30 @@
+"""Partial index for unused password reset tokens
+
+Revision ID: 0005_password_reset_partial
+Revises: 0004_children_listing_sort
+Create Date: 2026-08-27 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '0005_password_reset_partial'
+down_revision = '0004_children_listing_sort'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # validate_password_reset_token fetches a user's live tokens; a
+    # partial index keeps used rows out so validation is one small probe
+    op.create_index(
+        'idx_password_reset_user_unused', 'password_reset_tokens',
+        ['user_id'],
+        unique=False,
+        postgresql_where=sa.text('used_at IS NULL')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_password_reset_user_unused', table_name='password_reset_tokens')
@@ -1,4 +1,4 @@
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Annotated
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
@@ -18,11 +18,15 @@ from app.core.security import (
     create_password_reset_token, verify_password_reset_token,
     validate_password, get_current_user_token
 )
-from app.emails.email_sender import send_password_reset_email
+from app.core.revocation_cache import revocation_cache
+from app.core.token_cache import verify_token_cached
+from app.emails.email_sender import queue_password_reset_email
 from app.core.config import settings
 
 router = APIRouter(prefix="/api/v1/auth", tags=["Authentication"])
 
+_UTC = timezone.utc
+
 
 @router.post("/register", response_model=Message, status_code=status.HTTP_201_CREATED)
 async def register(
@@ -75,7 +79,9 @@ async def refresh_token(
 ) -> Token:
     """Refresh access token using refresh token."""
     try:
-        payload = verify_token(token_data.refresh_token)
+        # Cached verification: repeated refreshes of the same token within
+        # the TTL skip the signature check; revocation is still enforced below
+        payload = verify_token_cached(token_data.refresh_token)
         
         # Check if it's a refresh token
         if payload.get("type") != "refresh":
@@ -84,9 +90,11 @@ async def refresh_token(
                 detail="Invalid token type"
             )
         
-        # Check if token is revoked
+        # Check if token is revoked (in-process cache first, DB on cold cache)
         jti = payload.get("jti")
-        if await is_token_revoked(db, jti):
+        if revocation_cache.contains(jti) or (
+            not revocation_cache.authoritative and await is_token_revoked(db, jti)
+        ):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Token has been revoked"
@@ -126,8 +134,10 @@ async def logout(
     user_id = UUID(current_user.get("sub"))
     exp = current_user.get("exp")
     
-    # Calculate expiration datetime
-    expires_at = datetime.utcfromtimestamp(exp)
+    # Calculate expiration datetime (utcfromtimestamp is deprecated and
+    # builds a naive value the slow way); strip tzinfo before persisting
+    # since the DateTime columns store naive UTC
+    expires_at = datetime.fromtimestamp(exp, tz=_UTC).replace(tzinfo=None)
     
     # Revoke token
     await revoke_token(db, jti, user_id, "access", expires_at)
@@ -141,17 +151,19 @@ async def request_password_reset(
     db: Annotated[AsyncSession, Depends(get_async_session)]
 ) -> Message:
     """Request password reset token."""
+    # Without SMTP no email can be sent, so skip the user lookup entirely
+    # instead of spending a DB round-trip per request
+    if not settings.smtp_host:
+        return Message(message="If your email is registered, you will receive a password reset link.")
+
     user = await get_user_by_email(db, reset_data.email)
-    
+
     # Always return success message for security (don't reveal if email exists)
     if user and user.is_active:
-        # Create reset token
+        # Create reset token and hand the email to the background worker
         reset_token = create_password_reset_token(reset_data.email)
-        
-        # Send reset email if SMTP is configured
-        if settings.smtp_host:
-            await send_password_reset_email(reset_data.email, reset_token)
-    
+        await queue_password_reset_email(reset_data.email, reset_token)
+
     return Message(message="If your email is registered, you will receive a password reset link.")
 
 
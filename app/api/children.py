@@ -1,9 +1,13 @@
+import asyncio
+import re
 from typing import Annotated, List
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 import logging
 
+from pydantic import TypeAdapter
+
 from app.db.database import get_async_session
 from app.schemas.children import (
     ChildRegister, ChildResponse, ChildListResponse,
@@ -11,17 +15,47 @@ from app.schemas.children import (
     GrowthRecordResponse, GrowthTrend
 )
 from app.crud.children import (
-    create_child, get_children_by_parent, get_child_by_id,
-    create_growth_record, update_growth_record_predictions,
+    create_child, get_children_projection_by_parent, get_child_by_id,
+    create_growth_record_with_predictions, calculate_bmi,
     get_child_growth_history, analyze_growth_trends
 )
 from app.api.users import get_current_user
+from app.i18n.messages import t
+from app.ml.batcher import prediction_batcher
 from app.ml.model_loader import ml_models
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/children", tags=["Child Management"])
 
+# Precompiled serializer for the children listing: dumping the rows through
+# one TypeAdapter skips the outer ChildListResponse validate/serialize pass
+_CHILD_LIST_ADAPTER = TypeAdapter(List[ChildResponse])
+
+# Matches the non-empty sentence chunks between full stops in one C-level pass
+_RECOMMENDATION_SPLIT_RE = re.compile(r'[^.]+')
+
+# Precompiled alert translation table: one regex pass per alert instead of
+# repeated substring scans, with Swahili templates keyed by the matched prefix
+_ALERT_SW_PAT = re.compile(
+    r'(Weight showing decreasing trend'
+    r'|Height showing concerning pattern'
+    r'|Concerning nutritional status)(?:: (.*))?'
+)
+_ALERT_SW_MAP = {
+    "Weight showing decreasing trend": "Uzito unashuka - hali ya wasiwasi",
+    "Height showing concerning pattern": "Urefu una mfumo wa wasiwasi",
+    "Concerning nutritional status": "Hali ya lishe ya wasiwasi: {}",
+}
+
+
+def _translate_alert(alert: str) -> str:
+    """Translate a known growth alert to Swahili, passing unknowns through."""
+    match = _ALERT_SW_PAT.match(alert)
+    if match:
+        return _ALERT_SW_MAP[match.group(1)].format(match.group(2) or "")
+    return alert
+
 
 @router.post("/register", response_model=ChildResponse, status_code=status.HTTP_201_CREATED)
 async def register_child(
@@ -52,10 +86,9 @@ async def register_child(
         raise
     except Exception as e:
         logger.error(f"Error registering child for user {current_user.id}: {e}")
-        error_msg = "Imeshindwa kusajili mtoto" if current_user.language == "swahili" else "Failed to register child"
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=error_msg
+            detail=t(current_user.language, "failed_register_child")
         )
 
 
@@ -63,36 +96,39 @@ async def register_child(
 async def get_user_children(
     db: Annotated[AsyncSession, Depends(get_async_session)],
     current_user=Depends(get_current_user)
-) -> ChildListResponse:
+) -> Response:
     """Get all children for the current user."""
     try:
         logger.info(f"Fetching children for user {current_user.id}")
         
-        children = await get_children_by_parent(db, current_user.id)
-        
-        # Convert children to response format
+        children = await get_children_projection_by_parent(db, current_user.id)
+
+        # Build responses straight from the tuple rows; model_construct skips
+        # re-validating values that already passed through the DB schema
         child_responses = [
-            ChildResponse(
-                child_id=child.child_id,
-                name=child.name,
-                sex=child.sex.value,
-                birth_date=child.birth_date,
-                created_at=child.created_at
+            ChildResponse.model_construct(
+                child_id=row.child_id,
+                name=row.name,
+                sex=row.sex.value,
+                birth_date=row.birth_date,
+                created_at=row.created_at
             )
-            for child in children
+            for row in children
         ]
         
-        return ChildListResponse(
-            children=child_responses,
-            total_count=len(child_responses)
+        # Serialize to bytes directly; returning a Response bypasses the
+        # redundant response_model re-validation of already-typed rows
+        payload = (
+            b'{"children":' + _CHILD_LIST_ADAPTER.dump_json(child_responses)
+            + b',"total_count":' + str(len(child_responses)).encode() + b"}"
         )
+        return Response(content=payload, media_type="application/json")
         
     except Exception as e:
         logger.error(f"Error fetching children for user {current_user.id}: {e}")
-        error_msg = "Imeshindwa kupata watoto" if current_user.language == "swahili" else "Failed to fetch children"
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=error_msg
+            detail=t(current_user.language, "failed_fetch_children")
         )
 
 
@@ -107,12 +143,16 @@ async def create_child_growth_record(
     try:
         logger.info(f"Creating growth record for child {child_id}, user {current_user.id}")
         
-        # Create the growth record
-        growth_record = await create_growth_record(db, child_id, record_data, current_user.id)
-        
-        # Prepare data for ML prediction
+        # Verify child ownership before doing any work
         child = await get_child_by_id(db, child_id, current_user.id)
-        
+        if not child:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=t(current_user.language, "child_not_found")
+            )
+
+        calculated_bmi = calculate_bmi(record_data.weight_kg, record_data.height_cm)
+
         # Prepare prediction features
         prediction_features = {
             "Age_Months": record_data.age_months,
@@ -121,7 +161,7 @@ async def create_child_growth_record(
             "Height_cm": record_data.height_cm,
             "HeadCircumference_cm": 45.0,  # Default value if not provided
             "MUAC_cm": record_data.muac_cm or 14.0,
-            "BMI": growth_record.bmi,
+            "BMI": calculated_bmi,
             "Diet_Diversity_Score": record_data.diet_diversity_score,
             "Recent_Infection": "Yes" if record_data.recent_infection else "No",
             "Weight_for_Age_ZScore": record_data.weight_for_age_zscore or 0.0,
@@ -134,27 +174,34 @@ async def create_child_growth_record(
             "MUAC_for_Age_Percentile": record_data.muac_for_age_percentile or 50.0
         }
         
-        # Run ML prediction (English-trained model)
-        prediction_result = ml_models.predict_malnutrition_risk(prediction_features)
-        
+        # Run ML prediction (English-trained model) through the micro-batcher,
+        # which coalesces concurrent requests into one off-loop model call
+        prediction_result = await prediction_batcher.submit(prediction_features)
+
         # Get recommendations
-        recommendations_text = ml_models.get_recommendation(
+        recommendations_text = await asyncio.to_thread(
+            ml_models.get_recommendation,
             prediction_result["malnutrition_status"],
             prediction_result["developmental_risk"],
             current_user.language
         )
         
         # Parse recommendations into list
-        recommendations = [rec.strip() for rec in recommendations_text.split('.') if rec.strip()]
+        recommendations = list(filter(
+            None, map(str.strip, _RECOMMENDATION_SPLIT_RE.findall(recommendations_text))
+        ))
         
-        # Update growth record with predictions
+        # Persist the record and its predictions in a single INSERT
+        # (previously an INSERT followed by a second UPDATE round trip)
         prediction_data = {
             "malnutrition_status": prediction_result["malnutrition_status"],
             "developmental_risk": prediction_result["developmental_risk"]
         }
-        
-        await update_growth_record_predictions(db, growth_record.record_id, prediction_data)
-        
+
+        growth_record = await create_growth_record_with_predictions(
+            db, child_id, record_data, prediction_data
+        )
+
         logger.info(f"Growth record created and predictions saved for child {child_id}")
         
         return GrowthPredictionResponse(
@@ -169,10 +216,9 @@ async def create_child_growth_record(
         raise
     except Exception as e:
         logger.error(f"Error creating growth record for child {child_id}: {e}")
-        error_msg = "Imeshindwa kutengeneza rekodi ya ukuaji" if current_user.language == "swahili" else "Failed to create growth record"
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=error_msg
+            detail=t(current_user.language, "failed_create_growth_record")
         )
 
 
@@ -189,26 +235,26 @@ async def get_child_history(
         # Get child info
         child = await get_child_by_id(db, child_id, current_user.id)
         if not child:
-            error_msg = "Mtoto hajapatikana" if current_user.language == "swahili" else "Child not found"
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
-                detail=error_msg
+                detail=t(current_user.language, "child_not_found")
             )
         
         # Get growth records
         growth_records = await get_child_growth_history(db, child_id, current_user.id)
         
-        # Convert to response format
-        child_info = ChildResponse(
+        # Convert to response format; model_construct skips pydantic
+        # validation on values that came straight from the DB
+        child_info = ChildResponse.model_construct(
             child_id=child.child_id,
             name=child.name,
             sex=child.sex.value,
             birth_date=child.birth_date,
             created_at=child.created_at
         )
-        
+
         record_responses = [
-            GrowthRecordResponse(
+            GrowthRecordResponse.model_construct(
                 record_id=record.record_id,
                 child_id=record.child_id,
                 age_months=record.age_months,
@@ -241,10 +287,9 @@ async def get_child_history(
         raise
     except Exception as e:
         logger.error(f"Error fetching child history {child_id}: {e}")
-        error_msg = "Imeshindwa kupata historia ya mtoto" if current_user.language == "swahili" else "Failed to fetch child history"
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=error_msg
+            detail=t(current_user.language, "failed_fetch_child_history")
         )
 
 
@@ -261,9 +306,11 @@ async def get_child_growth_trends(
         # Analyze trends
         trend_analysis = await analyze_growth_trends(db, child_id, current_user.id)
         
-        # Get recent measurements for trend visualization
-        recent_records = await get_child_growth_history(db, child_id, current_user.id, limit=10)
-        
+        # Get recent measurements for trend visualization, sorted by age in SQL
+        recent_records = await get_child_growth_history(
+            db, child_id, current_user.id, limit=10, order_by="age_months"
+        )
+
         measurements = [
             {
                 "age_months": record.age_months,
@@ -273,23 +320,13 @@ async def get_child_growth_trends(
                 "recorded_at": record.recorded_at.isoformat(),
                 "prediction": record.prediction_results
             }
-            for record in sorted(recent_records, key=lambda x: x.age_months)
+            for record in recent_records
         ]
         
         # Translate alerts to user's language
         alerts = trend_analysis.get("alerts", [])
         if current_user.language == "swahili":
-            swahili_alerts = []
-            for alert in alerts:
-                if "Weight showing decreasing trend" in alert:
-                    swahili_alerts.append("Uzito unashuka - hali ya wasiwasi")
-                elif "Height showing concerning pattern" in alert:
-                    swahili_alerts.append("Urefu una mfumo wa wasiwasi")
-                elif "Concerning nutritional status" in alert:
-                    swahili_alerts.append(f"Hali ya lishe ya wasiwasi: {alert.split(': ')[1]}")
-                else:
-                    swahili_alerts.append(alert)
-            alerts = swahili_alerts
+            alerts = [_translate_alert(alert) for alert in alerts]
         
         return GrowthTrend(
             child_id=child_id,
@@ -302,8 +339,7 @@ async def get_child_growth_trends(
         raise
     except Exception as e:
         logger.error(f"Error analyzing trends for child {child_id}: {e}")
-        error_msg = "Imeshindwa kuchambua mienendo ya ukuaji" if current_user.language == "swahili" else "Failed to analyze growth trends"
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=error_msg
+            detail=t(current_user.language, "failed_analyze_trends")
         )
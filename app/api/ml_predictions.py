@@ -1,3 +1,4 @@
+import asyncio
 from typing import Annotated
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -10,6 +11,9 @@ from app.schemas.ml_models import (
     RecommendationRequest, RecommendationResponse
 )
 from app.api.users import get_current_user
+from app.i18n.messages import t
+from app.ml.batcher import prediction_batcher
+from app.ml.chat_worker import chat_worker
 from app.ml.model_loader import ml_models
 
 logger = logging.getLogger(__name__)
@@ -30,32 +34,31 @@ async def chatbot_question(
     sleep, and general parenting advice.
     """
     try:
-        logger.info(f"Chatbot question from user {current_user.id}: {request.question[:50]}...")
+        logger.info("Chatbot question from user %s: %.50s...", current_user.id, request.question)
         
         # Use language from request or user's preference
         language = request.language or current_user.language
         
-        # Get answer from chatbot model
-        answer = ml_models.get_chatbot_answer(request.question, language)
+        # Get answer through the single-worker inference loop, which owns
+        # the chatbot model and runs requests in arrival order
+        answer = await chat_worker.submit(request.question, language)
         
         if not answer or len(answer.strip()) < 10:
-            error_msg = "Imeshindwa kutoa jibu sahihi. Tafadhali jaribu tena." if language == "swahili" else "Unable to generate a proper response. Please try again."
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=error_msg
+                detail=t(language, "chatbot_no_answer")
             )
         
-        logger.info(f"Chatbot response generated for user {current_user.id} in {language}")
+        logger.info("Chatbot response generated for user %s in %s", current_user.id, language)
         return ChatbotResponse(answer=answer)
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Chatbot error for user {current_user.id}: {e}")
-        error_msg = "Kosa katika kuchakata swali lako. Tafadhali jaribu tena." if (request.language or current_user.language) == "swahili" else "Error processing your question. Please try again."
+        logger.error("Chatbot error for user %s: %s", current_user.id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=error_msg
+            detail=t(request.language or current_user.language, "chatbot_error")
         )
 
 
@@ -72,39 +75,40 @@ async def predict_malnutrition_risk(
     - Developmental risk (No Risk, At Risk, High Risk)
     """
     try:
-        logger.info(f"Prediction request from user {current_user.id} for {request.Age_Months} month old {request.Sex}")
-        
-        # Convert request to dictionary
-        features = request.model_dump()
-        
-        # Validate critical features
+        logger.info("Prediction request from user %s for %s month old %s", current_user.id, request.Age_Months, request.Sex)
+
+        # Validate critical features before paying for the full model_dump
         if request.Age_Months <= 0:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Age must be greater than 0 months"
             )
-        
+
         if request.Weight_kg <= 0 or request.Height_cm <= 0:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Weight and height must be positive values"
             )
-        
-        # Get prediction from model
-        prediction_result = ml_models.predict_malnutrition_risk(features)
+
+        # Convert request to dictionary
+        features = request.model_dump()
+
+        # Get prediction through the micro-batcher, which coalesces
+        # concurrent requests into one off-loop model call
+        prediction_result = await prediction_batcher.submit(features)
         
         response = PredictionResponse(
             malnutrition_status=prediction_result["malnutrition_status"],
             developmental_risk=prediction_result["developmental_risk"]
         )
         
-        logger.info(f"Prediction completed for user {current_user.id}: {response.malnutrition_status}, {response.developmental_risk}")
+        logger.info("Prediction completed for user %s: %s, %s", current_user.id, response.malnutrition_status, response.developmental_risk)
         return response
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Prediction error for user {current_user.id}: {e}")
+        logger.error("Prediction error for user %s: %s", current_user.id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Error processing prediction. Please check your input data."
@@ -123,38 +127,37 @@ async def get_nutrition_recommendation(
     based on the child's malnutrition status and developmental risk.
     """
     try:
-        logger.info(f"Recommendation request from user {current_user.id}: {request.malnutrition_status}, {request.developmental_risk}")
+        logger.info("Recommendation request from user %s: %s, %s", current_user.id, request.malnutrition_status, request.developmental_risk)
         
         # Use language from request or user's preference
         language = request.language or current_user.language
         
-        # Get recommendation from model
-        recommendation = ml_models.get_recommendation(
+        # Get recommendation from model without blocking the event loop
+        recommendation = await asyncio.to_thread(
+            ml_models.get_recommendation,
             request.malnutrition_status,
             request.developmental_risk,
             language
         )
         
         if not recommendation or len(recommendation.strip()) < 20:
-            error_msg = "Imeshindwa kutoa mapendekezo sahihi. Tafadhali jaribu tena." if language == "swahili" else "Unable to generate proper recommendations. Please try again."
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=error_msg
+                detail=t(language, "recommendation_invalid")
             )
         
         response = RecommendationResponse(recommendation=recommendation)
         
-        logger.info(f"Recommendation completed for user {current_user.id} in {language}")
+        logger.info("Recommendation completed for user %s in %s", current_user.id, language)
         return response
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Recommendation error for user {current_user.id}: {e}")
-        error_msg = "Kosa katika kutengeneza mapendekezo. Tafadhali jaribu tena." if (request.language or current_user.language) == "swahili" else "Error generating recommendations. Please try again."
+        logger.error("Recommendation error for user %s: %s", current_user.id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=error_msg
+            detail=t(request.language or current_user.language, "recommendation_error")
         )
 
 
@@ -171,33 +174,44 @@ async def analyze_child_nutrition(
     for mobile apps that need both results together.
     """
     try:
-        logger.info(f"Complete analysis request from user {current_user.id}")
-        
-        # Convert request to dictionary
-        features = request.model_dump()
-        
-        # Validate critical features
+        logger.info("Complete analysis request from user %s", current_user.id)
+
+        # Validate critical features before paying for the full model_dump
         if request.Age_Months <= 0:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Age must be greater than 0 months"
             )
-        
+
         if request.Weight_kg <= 0 or request.Height_cm <= 0:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Weight and height must be positive values"
             )
-        
-        # Get prediction
-        prediction_result = ml_models.predict_malnutrition_risk(features)
-        
-        # Get recommendation based on prediction
-        recommendation = ml_models.get_recommendation(
-            prediction_result["malnutrition_status"],
-            prediction_result["developmental_risk"],
-            current_user.language
-        )
+
+        # Convert request to dictionary
+        features = request.model_dump()
+
+        # Get prediction through the micro-batcher
+        prediction_result = await prediction_batcher.submit(features)
+
+        # Get recommendation based on prediction. The recommendation cannot
+        # run concurrently with the prediction (it consumes its outputs),
+        # but when no model is loaded the fallback is a static dict lookup
+        # and the thread hop is pure overhead
+        if ml_models.recommendation_model is None:
+            recommendation = ml_models.get_recommendation(
+                prediction_result["malnutrition_status"],
+                prediction_result["developmental_risk"],
+                current_user.language
+            )
+        else:
+            recommendation = await asyncio.to_thread(
+                ml_models.get_recommendation,
+                prediction_result["malnutrition_status"],
+                prediction_result["developmental_risk"],
+                current_user.language
+            )
         
         response = {
             "prediction": {
@@ -213,13 +227,13 @@ async def analyze_child_nutrition(
             }
         }
         
-        logger.info(f"Complete analysis completed for user {current_user.id}")
+        logger.info("Complete analysis completed for user %s", current_user.id)
         return response
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Analysis error for user {current_user.id}: {e}")
+        logger.error("Analysis error for user %s: %s", current_user.id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Error performing nutritional analysis. Please check your input data."
@@ -6,7 +6,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.database import get_async_session
 from app.schemas.auth import UserProfile, Message
 from app.schemas.ml_models import LanguagePreference, LanguageResponse
-from app.crud.user import get_user_by_id, is_token_revoked, update_user_language
+from app.crud.user import (
+    get_auth_context, get_user_by_id, update_user_language,
+    get_cached_user, cache_user
+)
+from app.core.revocation_cache import revocation_cache
 from app.core.security import get_current_user_token
 
 router = APIRouter(prefix="/api/v1/users", tags=["Users"])
@@ -19,22 +23,40 @@ async def get_current_user(
     """Get current authenticated user from token."""
     jti = current_user_token.get("jti")
     user_id = UUID(current_user_token.get("sub"))
-    
-    # Check if token is revoked
-    if await is_token_revoked(db, jti):
+
+    # Revocation first: the in-process cache answers without the DB, and
+    # when warmed it is the authoritative set of live revocations
+    if revocation_cache.contains(jti):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token has been revoked"
         )
-    
-    # Get user from database
-    user = await get_user_by_id(db, user_id)
+
+    # With revocation settled, a recently cached user row skips the DB
+    user = get_cached_user(user_id) if revocation_cache.authoritative else None
+    if user is None:
+        if revocation_cache.authoritative:
+            # The cache miss above already answered revocation; only the
+            # user row is needed, without the revoked-jti EXISTS probe
+            user = await get_user_by_id(db, user_id)
+        else:
+            # Fetch user row and revocation state in one round-trip
+            user, revoked = await get_auth_context(db, jti, user_id)
+            if revoked:
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="Token has been revoked"
+                )
+
+        if user is not None:
+            cache_user(user)
+
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found"
         )
-    
+
     if not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
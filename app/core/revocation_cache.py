@@ -0,0 +1,91 @@
+import asyncio
+import logging
+from datetime import datetime
+from typing import Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# How often the background sweeper evicts expired entries
+SWEEP_INTERVAL_SECONDS = 30
+
+
+class RevocationCache:
+    """In-process cache of revoked JWT IDs (jtis).
+
+    Keeps the auth hot path off the database: every revocation performed by
+    this process is recorded here, and on startup the cache is warmed from
+    the revoked_tokens table so restarts don't lose state. Once warmed, a
+    cache miss is authoritative for a single-process deployment and no DB
+    lookup is needed; before warmup callers should fall back to the DB.
+    """
+
+    def __init__(self):
+        # jti -> expiry datetime (naive UTC, matching RevokedToken.expires_at)
+        self._revoked: dict = {}
+        self._lock = asyncio.Lock()
+        self._warmed = False
+        self._sweeper_task: Optional[asyncio.Task] = None
+
+    @property
+    def authoritative(self) -> bool:
+        """Whether a cache miss can be trusted without a DB lookup."""
+        return self._warmed
+
+    def contains(self, jti: Optional[str]) -> bool:
+        """Check if a token jti is revoked (single dict lookup)."""
+        if not jti:
+            return False
+        expires_at = self._revoked.get(jti)
+        if expires_at is None:
+            return False
+        if expires_at <= datetime.utcnow():
+            # Token expired on its own; no longer worth tracking
+            self._revoked.pop(jti, None)
+            return False
+        return True
+
+    def add(self, jti: str, expires_at: datetime) -> None:
+        """Record a revoked jti until its natural expiry."""
+        self._revoked[jti] = expires_at
+
+    async def warm(self, entries: Iterable[Tuple[str, datetime]]) -> None:
+        """Prime the cache from persisted revocations at startup."""
+        async with self._lock:
+            for jti, expires_at in entries:
+                self._revoked[jti] = expires_at
+            self._warmed = True
+        logger.info("Revocation cache warmed with %d entries", len(self._revoked))
+
+    def sweep(self) -> int:
+        """Evict entries whose tokens have expired; returns count removed."""
+        now = datetime.utcnow()
+        expired = [jti for jti, expires_at in self._revoked.items() if expires_at <= now]
+        for jti in expired:
+            self._revoked.pop(jti, None)
+        return len(expired)
+
+    def start_sweeper(self) -> None:
+        """Start the periodic eviction task (idempotent)."""
+        if self._sweeper_task is None or self._sweeper_task.done():
+            self._sweeper_task = asyncio.create_task(self._sweep_loop())
+
+    async def stop_sweeper(self) -> None:
+        """Cancel the periodic eviction task."""
+        if self._sweeper_task is not None:
+            self._sweeper_task.cancel()
+            try:
+                await self._sweeper_task
+            except asyncio.CancelledError:
+                pass
+            self._sweeper_task = None
+
+    async def _sweep_loop(self) -> None:
+        while True:
+            await asyncio.sleep(SWEEP_INTERVAL_SECONDS)
+            removed = self.sweep()
+            if removed:
+                logger.debug("Revocation cache evicted %d expired entries", removed)
+
+
+# Global instance shared by auth endpoints and token CRUD
+revocation_cache = RevocationCache()
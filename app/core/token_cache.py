@@ -0,0 +1,69 @@
+import threading
+import time
+
+# Cache sizing and freshness window for verified-token payloads
+CACHE_MAX_SIZE = 4096
+CACHE_TTL_SECONDS = 60
+
+
+class TokenVerifyCache:
+    """Short-TTL memoization of successful JWT verifications.
+
+    Signature verification is pure CPU work on the hot auth path, and the
+    same token is typically presented many times within its lifetime
+    (e.g. repeated refresh attempts from a flaky mobile connection).
+    Entries expire after a short TTL, and never outlive the token's own
+    exp claim. Revocation is unaffected: callers still consult the
+    revocation cache/DB after verification.
+    """
+
+    def __init__(self, max_size: int = CACHE_MAX_SIZE, ttl: int = CACHE_TTL_SECONDS):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: dict = {}  # token -> (payload, expires_at_epoch)
+        self._lock = threading.Lock()
+
+    def get(self, token: str):
+        """Return the cached payload for a token, or None."""
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is None:
+                return None
+            payload, expires_at = entry
+            if time.time() >= expires_at:
+                del self._entries[token]
+                return None
+            return payload
+
+    def put(self, token: str, payload: dict) -> None:
+        """Cache a verified payload until the TTL or the token's exp."""
+        expires_at = time.time() + self.ttl
+        exp = payload.get("exp")
+        if exp is not None:
+            expires_at = min(expires_at, float(exp))
+        with self._lock:
+            if len(self._entries) >= self.max_size and token not in self._entries:
+                # Drop the oldest insertion to stay bounded
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[token] = (payload, expires_at)
+
+    def invalidate(self, token: str) -> None:
+        """Remove a token's cached payload (e.g. after revocation)."""
+        with self._lock:
+            self._entries.pop(token, None)
+
+
+token_verify_cache = TokenVerifyCache()
+
+
+def verify_token_cached(token: str) -> dict:
+    """verify_token with a short-TTL cache in front of the signature check."""
+    # Imported here: security.py uses this module for its auth dependency,
+    # so a top-level import would be circular
+    from app.core.security import verify_token
+
+    payload = token_verify_cache.get(token)
+    if payload is None:
+        payload = verify_token(token)
+        token_verify_cache.put(token, payload)
+    return payload
@@ -2,8 +2,9 @@ from datetime import datetime, date
 from typing import List, Optional, Dict, Any
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, desc
+from sqlalchemy import select, update, and_, desc
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import aliased
 from fastapi import HTTPException, status
 
 from app.db.models import Child, GrowthRecord, SexEnum
@@ -44,6 +45,20 @@ async def get_children_by_parent(db: AsyncSession, parent_id: UUID) -> List[Chil
     return result.scalars().all()
 
 
+async def get_children_projection_by_parent(db: AsyncSession, parent_id: UUID):
+    """Get the response columns for a parent's children as plain tuple rows.
+
+    Selecting only the needed columns skips ORM object materialization and
+    attribute instrumentation for this read-only listing path.
+    """
+    result = await db.execute(
+        select(Child.child_id, Child.name, Child.sex, Child.birth_date, Child.created_at)
+        .where(Child.parent_id == parent_id)
+        .order_by(Child.created_at.desc())
+    )
+    return result.all()
+
+
 async def get_child_by_id(db: AsyncSession, child_id: UUID, parent_id: UUID) -> Optional[Child]:
     """Get a specific child by ID (ensuring it belongs to the parent)."""
     result = await db.execute(
@@ -54,13 +69,12 @@ async def get_child_by_id(db: AsyncSession, child_id: UUID, parent_id: UUID) ->
     return result.scalar_one_or_none()
 
 
-async def calculate_bmi(weight_kg: float, height_cm: float) -> float:
+def calculate_bmi(weight_kg: float, height_cm: float) -> float:
     """Calculate BMI from weight and height."""
-    height_m = height_cm / 100
-    return round(weight_kg / (height_m ** 2), 2)
+    return round(weight_kg / (height_cm * height_cm) * 10000.0, 2)
 
 
-async def calculate_age_months(birth_date: date, record_date: date = None) -> int:
+def calculate_age_months(birth_date: date, record_date: date = None) -> int:
     """Calculate age in months from birth date."""
     if record_date is None:
         record_date = date.today()
@@ -74,64 +88,58 @@ async def calculate_age_months(birth_date: date, record_date: date = None) -> in
     return (age_years * 12) + age_months
 
 
-async def create_growth_record(
-    db: AsyncSession, 
-    child_id: UUID, 
+# Optional Z-score/percentile fields copied verbatim into the JSON column
+_ZP_FIELDS = (
+    "weight_for_age_zscore", "height_for_age_zscore",
+    "bmi_for_age_zscore", "muac_for_age_zscore",
+    "weight_for_age_percentile", "height_for_age_percentile",
+    "bmi_for_age_percentile", "muac_for_age_percentile",
+)
+
+
+def _build_z_scores_percentiles(record_data: GrowthRecordCreate):
+    """Collect the optional Z-scores and percentiles provided by the caller."""
+    return {
+        k: v for k in _ZP_FIELDS if (v := getattr(record_data, k)) is not None
+    }
+
+
+async def create_growth_record_with_predictions(
+    db: AsyncSession,
+    child_id: UUID,
     record_data: GrowthRecordCreate,
-    parent_id: UUID
+    predictions: Dict[str, Any]
 ) -> GrowthRecord:
-    """Create a new growth record for a child."""
+    """Create a growth record with its prediction results in a single INSERT.
+
+    The caller is expected to have verified child ownership already; running
+    the ML prediction first lets the record and its results be persisted in
+    one statement instead of INSERT-then-UPDATE.
+    """
     try:
-        # Verify child belongs to parent
-        child = await get_child_by_id(db, child_id, parent_id)
-        if not child:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Child not found"
-            )
-        
-        # Calculate BMI
-        calculated_bmi = await calculate_bmi(record_data.weight_kg, record_data.height_cm)
-        
-        # Prepare Z-scores and percentiles if provided
-        z_scores_percentiles = {}
-        if record_data.weight_for_age_zscore is not None:
-            z_scores_percentiles["weight_for_age_zscore"] = record_data.weight_for_age_zscore
-        if record_data.height_for_age_zscore is not None:
-            z_scores_percentiles["height_for_age_zscore"] = record_data.height_for_age_zscore
-        if record_data.bmi_for_age_zscore is not None:
-            z_scores_percentiles["bmi_for_age_zscore"] = record_data.bmi_for_age_zscore
-        if record_data.muac_for_age_zscore is not None:
-            z_scores_percentiles["muac_for_age_zscore"] = record_data.muac_for_age_zscore
-        if record_data.weight_for_age_percentile is not None:
-            z_scores_percentiles["weight_for_age_percentile"] = record_data.weight_for_age_percentile
-        if record_data.height_for_age_percentile is not None:
-            z_scores_percentiles["height_for_age_percentile"] = record_data.height_for_age_percentile
-        if record_data.bmi_for_age_percentile is not None:
-            z_scores_percentiles["bmi_for_age_percentile"] = record_data.bmi_for_age_percentile
-        if record_data.muac_for_age_percentile is not None:
-            z_scores_percentiles["muac_for_age_percentile"] = record_data.muac_for_age_percentile
-        
-        # Create growth record
+        z_scores_percentiles = _build_z_scores_percentiles(record_data)
+
+        # Add timestamp to predictions (matches update_growth_record_predictions)
+        predictions = dict(predictions)
+        predictions["timestamp"] = datetime.utcnow().isoformat()
+
         db_record = GrowthRecord(
             child_id=child_id,
             age_months=record_data.age_months,
             weight_kg=record_data.weight_kg,
             height_cm=record_data.height_cm,
             muac_cm=record_data.muac_cm,
-            bmi=calculated_bmi,
             diet_diversity_score=record_data.diet_diversity_score,
             recent_infection=record_data.recent_infection,
-            z_scores_percentiles=z_scores_percentiles if z_scores_percentiles else None
+            z_scores_percentiles=z_scores_percentiles if z_scores_percentiles else None,
+            prediction_results=predictions
         )
-        
+
         db.add(db_record)
         await db.commit()
         await db.refresh(db_record)
         return db_record
-        
-    except HTTPException:
-        raise
+
     except Exception as e:
         await db.rollback()
         raise HTTPException(
@@ -145,35 +153,42 @@ async def update_growth_record_predictions(
     record_id: UUID,
     predictions: Dict[str, Any]
 ) -> bool:
-    """Update growth record with prediction results."""
+    """Update growth record with prediction results.
+
+    Issues a single UPDATE and uses its rowcount to detect a missing
+    record, instead of SELECTing the row first.
+    """
     try:
-        result = await db.execute(
-            select(GrowthRecord).where(GrowthRecord.record_id == record_id)
-        )
-        record = result.scalar_one_or_none()
-        
-        if not record:
-            return False
-        
         # Add timestamp to predictions
         predictions["timestamp"] = datetime.utcnow().isoformat()
-        record.prediction_results = predictions
-        
+
+        result = await db.execute(
+            update(GrowthRecord)
+            .where(GrowthRecord.record_id == record_id)
+            .values(prediction_results=predictions)
+        )
         await db.commit()
-        return True
-        
+        return result.rowcount > 0
+
     except Exception:
         await db.rollback()
         return False
 
 
 async def get_child_growth_history(
-    db: AsyncSession, 
-    child_id: UUID, 
+    db: AsyncSession,
+    child_id: UUID,
     parent_id: UUID,
-    limit: Optional[int] = None
+    limit: Optional[int] = None,
+    order_by: str = "recorded_at"
 ) -> List[GrowthRecord]:
-    """Get growth history for a child."""
+    """Get growth history for a child.
+
+    Orders by recorded_at (newest first) by default. Passing
+    order_by="age_months" returns the same records sorted by ascending
+    age in the DB: the limit always selects the most recent window (in a
+    subquery), never the lowest ages.
+    """
     # Verify child belongs to parent
     child = await get_child_by_id(db, child_id, parent_id)
     if not child:
@@ -181,18 +196,59 @@ async def get_child_growth_history(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Child not found"
         )
-    
-    query = select(GrowthRecord).where(
-        GrowthRecord.child_id == child_id
-    ).order_by(desc(GrowthRecord.recorded_at))
-    
+
+    query = (
+        select(GrowthRecord)
+        .where(GrowthRecord.child_id == child_id)
+        .order_by(desc(GrowthRecord.recorded_at))
+    )
     if limit:
         query = query.limit(limit)
-    
+
+    if order_by == "age_months":
+        recent = query.subquery()
+        query = select(aliased(GrowthRecord, recent)).order_by(recent.c.age_months.asc())
+
     result = await db.execute(query)
     return result.scalars().all()
 
 
+async def get_child_growth_history_lite(
+    db: AsyncSession,
+    child_id: UUID,
+    parent_id: UUID,
+    limit: Optional[int] = None
+):
+    """Get the trend-analysis columns of a child's history as tuple rows.
+
+    Selects only age/weight/height, skipping ORM materialization of full
+    records (and their JSON columns). The limit picks the most recent
+    window (recorded_at DESC subquery); the rows come back age-ascending.
+    """
+    # Verify child belongs to parent
+    child = await get_child_by_id(db, child_id, parent_id)
+    if not child:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Child not found"
+        )
+
+    recent = (
+        select(GrowthRecord.age_months, GrowthRecord.weight_kg, GrowthRecord.height_cm)
+        .where(GrowthRecord.child_id == child_id)
+        .order_by(desc(GrowthRecord.recorded_at))
+    )
+    if limit:
+        recent = recent.limit(limit)
+    recent = recent.subquery()
+
+    result = await db.execute(
+        select(recent.c.age_months, recent.c.weight_kg, recent.c.height_cm)
+        .order_by(recent.c.age_months.asc())
+    )
+    return result.all()
+
+
 async def get_latest_growth_record(
     db: AsyncSession,
     child_id: UUID,
@@ -209,48 +265,58 @@ async def analyze_growth_trends(
     parent_id: UUID
 ) -> Dict[str, Any]:
     """Analyze growth trends for a child."""
-    records = await get_child_growth_history(db, child_id, parent_id, limit=5)
-    
+    # Tuple rows, already age-sorted: the trend math only needs three columns
+    records = await get_child_growth_history_lite(db, child_id, parent_id, limit=5)
+
     if len(records) < 2:
         return {"trends": {}, "alerts": []}
-    
-    # Sort by age (oldest first for trend analysis)
-    records = sorted(records, key=lambda x: x.age_months)
-    
+
+    first, last = records[0], records[-1]
+
     trends = {}
     alerts = []
-    
-    # Analyze weight trend
-    weights = [r.weight_kg for r in records]
-    if len(weights) >= 2:
-        if weights[-1] > weights[0]:
-            trends["weight"] = "increasing"
-        elif weights[-1] < weights[0]:
-            trends["weight"] = "decreasing"
-            alerts.append("Weight showing decreasing trend")
-        else:
-            trends["weight"] = "stable"
-    
+
+    # Analyze weight trend from the endpoint measurements directly
+    if last.weight_kg > first.weight_kg:
+        trends["weight"] = "increasing"
+    elif last.weight_kg < first.weight_kg:
+        trends["weight"] = "decreasing"
+        alerts.append("Weight showing decreasing trend")
+    else:
+        trends["weight"] = "stable"
+
     # Analyze height trend
-    heights = [r.height_cm for r in records]
-    if len(heights) >= 2:
-        if heights[-1] > heights[0]:
-            trends["height"] = "increasing"
-        elif heights[-1] < heights[0]:
-            trends["height"] = "decreasing"
-            alerts.append("Height showing concerning pattern")
-        else:
-            trends["height"] = "stable"
-    
-    # Check for malnutrition alerts from recent predictions
-    recent_predictions = [r.prediction_results for r in records[-3:] if r.prediction_results]
+    if last.height_cm > first.height_cm:
+        trends["height"] = "increasing"
+    elif last.height_cm < first.height_cm:
+        trends["height"] = "decreasing"
+        alerts.append("Height showing concerning pattern")
+    else:
+        trends["height"] = "stable"
+
+    # Check for malnutrition alerts from recent predictions in SQL: the
+    # probe only looks at the 3 most recent records (as the Python scan
+    # did), so an old Severe result does not alert forever
     severe_statuses = ["Severe", "Stunting", "Underweight"]
-    
-    for pred in recent_predictions:
-        if pred and pred.get("malnutrition_status") in severe_statuses:
-            alerts.append(f"Concerning nutritional status: {pred.get('malnutrition_status')}")
-            break
-    
+    recent_preds = (
+        select(
+            GrowthRecord.prediction_results["malnutrition_status"]
+            .as_string().label("malnutrition_status")
+        )
+        .where(GrowthRecord.child_id == child_id)
+        .order_by(desc(GrowthRecord.recorded_at))
+        .limit(3)
+        .subquery()
+    )
+    result = await db.execute(
+        select(recent_preds.c.malnutrition_status)
+        .where(recent_preds.c.malnutrition_status.in_(severe_statuses))
+        .limit(1)
+    )
+    concerning_status = result.scalar_one_or_none()
+    if concerning_status:
+        alerts.append(f"Concerning nutritional status: {concerning_status}")
+
     return {
         "trends": trends,
         "alerts": alerts,
@@ -1,15 +1,55 @@
+import asyncio
+import hmac
+import logging
+import time
 from datetime import datetime, timedelta
 from typing import Optional
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, update, delete, exists, and_, func
 from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status
 
 from app.db.models import User, RevokedToken, PasswordResetToken
+from app.core.revocation_cache import revocation_cache
 from app.core.security import get_password_hash, verify_password
 from app.schemas.auth import UserRegister
 
+logger = logging.getLogger(__name__)
+
+
+# Short-TTL cache of user rows keyed by user id. Access tokens live for
+# minutes, so the same user row is fetched for every request; a 60s
+# window removes most of those round-trips while keeping profile edits
+# visible quickly. Writes that change the row invalidate the entry.
+USER_CACHE_TTL_SECONDS = 60
+USER_CACHE_MAX_SIZE = 10_000
+_user_cache: dict = {}  # user_id -> (user, expires_at_monotonic)
+
+
+def get_cached_user(user_id: UUID) -> Optional[User]:
+    """Return a recently fetched user row, or None."""
+    entry = _user_cache.get(user_id)
+    if entry is None:
+        return None
+    user, expires_at = entry
+    if time.monotonic() >= expires_at:
+        del _user_cache[user_id]
+        return None
+    return user
+
+
+def cache_user(user: User) -> None:
+    """Cache a user row for the TTL window."""
+    if len(_user_cache) >= USER_CACHE_MAX_SIZE and user.id not in _user_cache:
+        _user_cache.pop(next(iter(_user_cache)))
+    _user_cache[user.id] = (user, time.monotonic() + USER_CACHE_TTL_SECONDS)
+
+
+def invalidate_user_cache(user_id: UUID) -> None:
+    """Drop a user's cached row after a write."""
+    _user_cache.pop(user_id, None)
+
 
 async def get_user_by_email(db: AsyncSession, email: str) -> Optional[User]:
     """Get user by email address."""
@@ -18,15 +58,22 @@ async def get_user_by_email(db: AsyncSession, email: str) -> Optional[User]:
 
 
 async def get_user_by_id(db: AsyncSession, user_id: UUID) -> Optional[User]:
-    """Get user by ID."""
-    result = await db.execute(select(User).where(User.id == user_id))
-    return result.scalar_one_or_none()
+    """Get user by ID, via the short-TTL cache when possible."""
+    user = get_cached_user(user_id)
+    if user is not None:
+        return user
+    # session.get is the PK fast path: it consults the session's identity
+    # map first and skips query compilation on the miss
+    user = await db.get(User, user_id)
+    if user is not None:
+        cache_user(user)
+    return user
 
 
 async def create_user(db: AsyncSession, user: UserRegister) -> User:
     """Create a new user."""
-    # Hash the password
-    hashed_password = get_password_hash(user.password)
+    # Hash the password off the event loop (bcrypt is CPU-bound)
+    hashed_password = await asyncio.to_thread(get_password_hash, user.password)
     
     # Create user instance
     db_user = User(
@@ -52,42 +99,80 @@ async def create_user(db: AsyncSession, user: UserRegister) -> User:
         )
 
 
+# Verified against when the email is unknown, so login latency does not
+# reveal whether an address is registered (user-enumeration timing channel)
+_DUMMY_PASSWORD_HASH = get_password_hash("dummy-password-for-timing")
+
+
 async def authenticate_user(db: AsyncSession, email: str, password: str) -> Optional[User]:
-    """Authenticate user with email and password."""
+    """Authenticate user with email and password.
+
+    Always performs one bcrypt verification — against a dummy hash when the
+    email is unknown — so failed logins take the same time either way.
+    """
     user = await get_user_by_email(db, email)
-    if not user:
-        return None
-    if not user.is_active:
-        return None
-    if not verify_password(password, user.password_hash):
-        return None
-    return user
+    # bcrypt verification is CPU-bound; run it in the thread pool so the
+    # event loop keeps serving other requests
+    ok = await asyncio.to_thread(
+        verify_password, password,
+        user.password_hash if user else _DUMMY_PASSWORD_HASH
+    )
+    if ok and user is not None and user.is_active:
+        return user
+    return None
 
 
 async def update_user_password(db: AsyncSession, user_id: UUID, new_password: str) -> bool:
-    """Update user password."""
-    user = await get_user_by_id(db, user_id)
-    if not user:
-        return False
-    
-    user.password_hash = get_password_hash(new_password)
-    user.updated_at = datetime.utcnow()
-    
+    """Update user password with a single UPDATE statement."""
+    password_hash = await asyncio.to_thread(get_password_hash, new_password)
+    result = await db.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(password_hash=password_hash, updated_at=datetime.utcnow())
+    )
     await db.commit()
-    return True
+    invalidate_user_cache(user_id)
+    return result.rowcount > 0
 
 
-async def is_token_revoked(db: AsyncSession, jti: str) -> bool:
-    """Check if a token is revoked."""
-    result = await db.execute(
-        select(RevokedToken).where(
+async def get_auth_context(db: AsyncSession, jti: str, user_id: UUID):
+    """Fetch the user row and token revocation state in a single query.
+
+    Returns a (user, revoked) tuple; used by the per-request auth
+    dependency to avoid issuing separate revocation and user lookups.
+    """
+    revoked_subquery = (
+        select(RevokedToken.jti)
+        .where(
             and_(
                 RevokedToken.jti == jti,
-                RevokedToken.expires_at > datetime.utcnow()
+                RevokedToken.expires_at > func.now()
+            )
+        )
+        .exists()
+    )
+    result = await db.execute(
+        select(User, revoked_subquery).where(User.id == user_id)
+    )
+    row = result.one_or_none()
+    if row is None:
+        return None, False
+    return row[0], row[1]
+
+
+async def is_token_revoked(db: AsyncSession, jti: str) -> bool:
+    """Check if a token is revoked via an EXISTS probe (no row hydration)."""
+    result = await db.execute(
+        select(
+            exists().where(
+                and_(
+                    RevokedToken.jti == jti,
+                    RevokedToken.expires_at > func.now()
+                )
             )
         )
     )
-    return result.scalar_one_or_none() is not None
+    return bool(result.scalar())
 
 
 async def revoke_token(
@@ -108,18 +193,67 @@ async def revoke_token(
     db.add(revoked_token)
     await db.commit()
 
+    # Keep the in-process cache in sync so the auth hot path skips the DB
+    revocation_cache.add(jti, expires_at)
 
-async def cleanup_expired_tokens(db: AsyncSession) -> None:
-    """Clean up expired revoked tokens."""
+
+async def warm_revocation_cache(db: AsyncSession) -> None:
+    """Prime the in-process revocation cache from persisted tokens."""
     result = await db.execute(
-        select(RevokedToken).where(RevokedToken.expires_at <= datetime.utcnow())
+        select(RevokedToken.jti, RevokedToken.expires_at).where(
+            RevokedToken.expires_at > func.now()
+        )
     )
-    expired_tokens = result.scalars().all()
-    
-    for token in expired_tokens:
-        await db.delete(token)
-    
-    await db.commit()
+    await revocation_cache.warm(result.all())
+
+
+# How many expired rows each cleanup DELETE may remove before committing
+CLEANUP_BATCH_SIZE = 1000
+
+
+async def cleanup_expired_tokens(db: AsyncSession) -> None:
+    """Clean up expired revoked and password reset tokens in bounded batches.
+
+    Deleting a long backlog in one statement holds locks and bloats the WAL
+    for its whole duration; deleting CLEANUP_BATCH_SIZE rows per statement
+    and committing between batches keeps each lock window short so cleanup
+    can run alongside production traffic.
+    """
+    deleted = 0
+    while True:
+        batch = (
+            select(RevokedToken.jti)
+            .where(RevokedToken.expires_at <= func.now())
+            .limit(CLEANUP_BATCH_SIZE)
+        )
+        result = await db.execute(
+            delete(RevokedToken)
+            .where(RevokedToken.jti.in_(batch))
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+        deleted += result.rowcount
+        if result.rowcount < CLEANUP_BATCH_SIZE:
+            break
+    logger.info("Deleted %d expired revoked tokens", deleted)
+
+    deleted = 0
+    while True:
+        batch = (
+            select(PasswordResetToken.id)
+            .where(PasswordResetToken.expires_at <= func.now())
+            .limit(CLEANUP_BATCH_SIZE)
+        )
+        result = await db.execute(
+            delete(PasswordResetToken)
+            .where(PasswordResetToken.id.in_(batch))
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+        deleted += result.rowcount
+        if result.rowcount < CLEANUP_BATCH_SIZE:
+            break
+    logger.info("Deleted %d expired password reset tokens", deleted)
 
 
 async def create_password_reset_token(
@@ -142,43 +276,62 @@ async def create_password_reset_token(
 
 
 async def validate_password_reset_token(
-    db: AsyncSession, 
-    token_hash: str
+    db: AsyncSession,
+    user_id: UUID,
+    candidate_hash: str
 ) -> Optional[PasswordResetToken]:
-    """Validate and get password reset token."""
+    """Validate and get a password reset token for a user.
+
+    Fetches the user's live tokens via the user_id index and compares the
+    hashes in Python with hmac.compare_digest, keeping the secret
+    comparison constant-time instead of relying on the database's
+    short-circuiting equality.
+    """
     result = await db.execute(
         select(PasswordResetToken).where(
             and_(
-                PasswordResetToken.token_hash == token_hash,
-                PasswordResetToken.expires_at > datetime.utcnow(),
+                PasswordResetToken.user_id == user_id,
+                PasswordResetToken.expires_at > func.now(),
                 PasswordResetToken.used_at.is_(None)
             )
         )
     )
-    return result.scalar_one_or_none()
+    for token in result.scalars():
+        if hmac.compare_digest(token.token_hash, candidate_hash):
+            return token
+    return None
 
 
 async def mark_password_reset_token_used(
-    db: AsyncSession, 
+    db: AsyncSession,
     token_id: UUID
-) -> None:
-    """Mark password reset token as used."""
+) -> bool:
+    """Mark password reset token as used with a single UPDATE.
+
+    The used_at IS NULL guard keeps redemption idempotent; the rowcount
+    says whether this call actually consumed the token.
+    """
     result = await db.execute(
-        select(PasswordResetToken).where(PasswordResetToken.id == token_id)
+        update(PasswordResetToken)
+        .where(
+            and_(
+                PasswordResetToken.id == token_id,
+                PasswordResetToken.used_at.is_(None)
+            )
+        )
+        .values(used_at=datetime.utcnow())
     )
-    token = result.scalar_one_or_none()
-    
-    if token:
-        token.used_at = datetime.utcnow()
-        await db.commit()
+    await db.commit()
+    return result.rowcount == 1
 
 
 async def update_user_language(db: AsyncSession, user_id: UUID, language: str) -> bool:
-    """Update user's language preference."""
-    user = await get_user_by_id(db, user_id)
-    if not user:
-        return False
-    user.language = language
-    user.updated_at = datetime.utcnow()
+    """Update user's language preference with a single UPDATE statement."""
+    result = await db.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(language=language, updated_at=datetime.utcnow())
+    )
     await db.commit()
-    return True
+    invalidate_user_cache(user_id)
+    return result.rowcount > 0
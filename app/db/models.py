@@ -1,18 +1,21 @@
 from datetime import datetime, date
 from uuid import uuid4
-from sqlalchemy import Column, String, Boolean, DateTime, Text, Index, Date, Integer, Float, ForeignKey, Enum
-from sqlalchemy.dialects.postgresql import UUID, JSON
+from sqlalchemy import Column, String, Boolean, DateTime, Text, Index, Date, Integer, Float, ForeignKey, Enum, Uuid, JSON, Computed, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 import enum
 
 from app.db.database import Base
 
+# JSONB on PostgreSQL (binary storage, indexable); plain JSON elsewhere
+JSONVariant = JSON().with_variant(JSONB(), "postgresql")
+
 
 class User(Base):
     """User model for authentication and profile data."""
     __tablename__ = "users"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    id = Column(Uuid, primary_key=True, default=uuid4)
     email = Column(String(255), unique=True, nullable=False, index=True)
     name = Column(String(255), nullable=False)
     phone = Column(String(20), nullable=True)
@@ -33,7 +36,7 @@ class RevokedToken(Base):
     
     jti = Column(String(36), primary_key=True)  # JWT ID
     token_type = Column(String(20), nullable=False)  # 'access' or 'refresh'
-    user_id = Column(UUID(as_uuid=True), nullable=False)
+    user_id = Column(Uuid, nullable=False)
     revoked_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     expires_at = Column(DateTime, nullable=False)
     
@@ -51,16 +54,21 @@ class PasswordResetToken(Base):
     """Model for password reset tokens."""
     __tablename__ = "password_reset_tokens"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    user_id = Column(UUID(as_uuid=True), nullable=False, index=True)
+    id = Column(Uuid, primary_key=True, default=uuid4)
+    user_id = Column(Uuid, nullable=False, index=True)
     token_hash = Column(String(255), nullable=False)  # Hashed token for security
     expires_at = Column(DateTime, nullable=False)
     used_at = Column(DateTime, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     
-    # Index for cleanup of expired tokens
+    # Indexes: cleanup of expired tokens, and validation of a user's
+    # live tokens (partial — used rows drop out of the index)
     __table_args__ = (
         Index('idx_password_reset_expires_at', 'expires_at'),
+        Index(
+            'idx_password_reset_user_unused', 'user_id',
+            postgresql_where=text('used_at IS NULL')
+        ),
     )
 
     def __repr__(self) -> str:
@@ -77,19 +85,26 @@ class Child(Base):
     """Child model for tracking children's growth and development."""
     __tablename__ = "children"
     
-    child_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    parent_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
+    child_id = Column(Uuid, primary_key=True, default=uuid4)
+    parent_id = Column(Uuid, ForeignKey("users.id"), nullable=False)
     name = Column(String(255), nullable=False)
     sex = Column(Enum(SexEnum), nullable=False)
     birth_date = Column(Date, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    
+
     # Relationship to parent (User)
     parent = relationship("User", backref="children")
-    
+
     # Relationship to growth records
     growth_records = relationship("GrowthRecord", back_populates="child", cascade="all, delete-orphan")
-    
+
+    # Keyed on the listing query's filter and sort, with the remaining
+    # response columns INCLUDEd so PostgreSQL answers it index-only
+    __table_args__ = (
+        Index('ix_children_parent_created', 'parent_id', created_at.desc(),
+              postgresql_include=['child_id', 'name', 'sex', 'birth_date']),
+    )
+
     def __repr__(self) -> str:
         return f"<Child(child_id={self.child_id}, name={self.name})>"
 
@@ -98,23 +113,26 @@ class GrowthRecord(Base):
     """Growth record model for tracking child measurements and predictions."""
     __tablename__ = "growth_records"
     
-    record_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    child_id = Column(UUID(as_uuid=True), ForeignKey("children.child_id"), nullable=False, index=True)
+    record_id = Column(Uuid, primary_key=True, default=uuid4)
+    child_id = Column(Uuid, ForeignKey("children.child_id"), nullable=False, index=True)
     
     # Measurements
     age_months = Column(Integer, nullable=False)
     weight_kg = Column(Float, nullable=False)
     height_cm = Column(Float, nullable=False)
     muac_cm = Column(Float, nullable=True)
-    bmi = Column(Float, nullable=True)
+    bmi = Column(Float,
+                 Computed('weight_kg / ((height_cm/100.0) * (height_cm/100.0))',
+                          persisted=True),
+                 nullable=True)
     diet_diversity_score = Column(Integer, nullable=False, default=0)
     recent_infection = Column(Boolean, nullable=False, default=False)
     
-    # Z-scores and percentiles (stored as JSON)
-    z_scores_percentiles = Column(JSON, nullable=True)
-    
-    # Prediction results (stored as JSON)
-    prediction_results = Column(JSON, nullable=True)
+    # Z-scores and percentiles (stored as JSONB on PostgreSQL)
+    z_scores_percentiles = Column(JSONVariant, nullable=True)
+
+    # Prediction results (stored as JSONB on PostgreSQL)
+    prediction_results = Column(JSONVariant, nullable=True)
     
     # Timestamps
     recorded_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -126,6 +144,8 @@ class GrowthRecord(Base):
     __table_args__ = (
         Index('idx_growth_records_child_recorded', 'child_id', 'recorded_at'),
         Index('idx_growth_records_age', 'age_months'),
+        Index('idx_growth_predictions_gin', 'prediction_results',
+              postgresql_using='gin'),
     )
     
     def __repr__(self) -> str:
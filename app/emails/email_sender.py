@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import Optional
 from email.mime.text import MIMEText
@@ -8,6 +9,44 @@ from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Shared SMTP connection: the TCP + STARTTLS + AUTH handshake is paid once
+# and reused across messages instead of per email. aiosmtplib clients are
+# not safe for concurrent use, so sends serialize on the lock.
+_smtp_client: Optional[aiosmtplib.SMTP] = None
+_smtp_lock = asyncio.Lock()
+
+
+async def _get_smtp_client() -> aiosmtplib.SMTP:
+    """Return the shared SMTP client, (re)connecting if needed."""
+    global _smtp_client
+    if _smtp_client is None:
+        _smtp_client = aiosmtplib.SMTP(
+            hostname=settings.smtp_host,
+            port=settings.smtp_port,
+            start_tls=True,
+            username=settings.smtp_user,
+            password=settings.smtp_password,
+        )
+    if not _smtp_client.is_connected:
+        await _smtp_client.connect()
+    return _smtp_client
+
+
+async def _send_over_shared_connection(message: MIMEMultipart) -> None:
+    """Send a message on the shared connection, retrying once if stale."""
+    global _smtp_client
+    async with _smtp_lock:
+        for attempt in (1, 2):
+            try:
+                client = await _get_smtp_client()
+                await client.send_message(message)
+                return
+            except aiosmtplib.SMTPServerDisconnected:
+                # Server closed an idle connection; rebuild and retry once
+                _smtp_client = None
+                if attempt == 2:
+                    raise
+
 
 async def send_email(
     to_email: str,
@@ -36,15 +75,8 @@ async def send_email(
         html_part = MIMEText(html_content, "html")
         message.attach(html_part)
 
-        # Send email
-        await aiosmtplib.send(
-            message,
-            hostname=settings.smtp_host,
-            port=settings.smtp_port,
-            start_tls=True,
-            username=settings.smtp_user,
-            password=settings.smtp_password,
-        )
+        # Send email over the persistent connection
+        await _send_over_shared_connection(message)
 
         logger.info(f"Email sent successfully to {to_email}")
         return True
@@ -54,20 +86,76 @@ async def send_email(
         return False
 
 
-async def send_password_reset_email(email: str, reset_token: str) -> bool:
-    """Send password reset email."""
-    reset_url = f"{settings.frontend_url}/reset-password?token={reset_token}"
-    
-    subject = f"Password Reset - {settings.app_name}"
-    
-    html_content = f"""
+# Out-of-band delivery: request handlers queue emails here and a single
+# background task performs the actual SMTP sends, so responses don't wait
+# on mail-server round-trips
+_email_queue: Optional[asyncio.Queue] = None
+_email_worker_task: Optional[asyncio.Task] = None
+
+
+def start_email_worker() -> None:
+    """Start the background email delivery task (idempotent)."""
+    global _email_queue, _email_worker_task
+    if _email_worker_task is None or _email_worker_task.done():
+        _email_queue = asyncio.Queue()
+        _email_worker_task = asyncio.create_task(_email_worker_loop())
+
+
+async def stop_email_worker() -> None:
+    """Deliver any queued emails, then stop the background task."""
+    global _email_queue, _email_worker_task
+    if _email_worker_task is not None:
+        if _email_queue is not None:
+            await _email_queue.join()
+        _email_worker_task.cancel()
+        try:
+            await _email_worker_task
+        except asyncio.CancelledError:
+            pass
+        _email_worker_task = None
+        _email_queue = None
+
+
+async def _email_worker_loop() -> None:
+    while True:
+        to_email, subject, html_content, text_content = await _email_queue.get()
+        try:
+            await send_email(to_email, subject, html_content, text_content)
+        except Exception as e:  # send_email already logs; belt and braces
+            logger.error(f"Background email delivery failed: {e}")
+        finally:
+            _email_queue.task_done()
+
+
+async def schedule_email(
+    to_email: str,
+    subject: str,
+    html_content: str,
+    text_content: Optional[str] = None
+) -> None:
+    """Queue an email for background delivery.
+
+    Falls back to an inline send when the worker isn't running (tests,
+    scripts), mirroring the other background workers in this app.
+    """
+    if _email_queue is None:
+        await send_email(to_email, subject, html_content, text_content)
+    else:
+        _email_queue.put_nowait((to_email, subject, html_content, text_content))
+
+
+# Email bodies are rendered from templates interpolated once at import —
+# only the tokenized URL varies per message
+_RESET_SUBJECT = f"Password Reset - {settings.app_name}"
+
+_RESET_HTML_TMPL = f"""
     <html>
         <body>
             <h2>Password Reset Request</h2>
             <p>Hello,</p>
             <p>You have requested to reset your password for {settings.app_name}.</p>
             <p>Click the link below to reset your password:</p>
-            <p><a href="{reset_url}">Reset Password</a></p>
+            <p><a href="{{reset_url}}">Reset Password</a></p>
             <p>This link will expire in 1 hour.</p>
             <p>If you did not request this password reset, please ignore this email.</p>
             <br>
@@ -75,8 +163,8 @@ async def send_password_reset_email(email: str, reset_token: str) -> bool:
         </body>
     </html>
     """
-    
-    text_content = f"""
+
+_RESET_TEXT_TMPL = f"""
     Password Reset Request
     
     Hello,
@@ -84,7 +172,7 @@ async def send_password_reset_email(email: str, reset_token: str) -> bool:
     You have requested to reset your password for {settings.app_name}.
     
     Click the link below to reset your password:
-    {reset_url}
+    {{reset_url}}
     
     This link will expire in 1 hour.
     
@@ -93,32 +181,25 @@ async def send_password_reset_email(email: str, reset_token: str) -> bool:
     Best regards,
     {settings.app_name} Team
     """
-    
-    return await send_email(email, subject, html_content, text_content)
 
+_VERIFY_SUBJECT = f"Email Verification - {settings.app_name}"
 
-async def send_verification_email(email: str, verification_token: str) -> bool:
-    """Send email verification email."""
-    verification_url = f"{settings.frontend_url}/verify-email?token={verification_token}"
-    
-    subject = f"Email Verification - {settings.app_name}"
-    
-    html_content = f"""
+_VERIFY_HTML_TMPL = f"""
     <html>
         <body>
             <h2>Email Verification</h2>
             <p>Hello,</p>
             <p>Thank you for registering with {settings.app_name}!</p>
             <p>Please click the link below to verify your email address:</p>
-            <p><a href="{verification_url}">Verify Email</a></p>
+            <p><a href="{{verification_url}}">Verify Email</a></p>
             <p>This link will expire in 24 hours.</p>
             <br>
             <p>Best regards,<br>{settings.app_name} Team</p>
         </body>
     </html>
     """
-    
-    text_content = f"""
+
+_VERIFY_TEXT_TMPL = f"""
     Email Verification
     
     Hello,
@@ -126,12 +207,54 @@ async def send_verification_email(email: str, verification_token: str) -> bool:
     Thank you for registering with {settings.app_name}!
     
     Please click the link below to verify your email address:
-    {verification_url}
+    {{verification_url}}
     
     This link will expire in 24 hours.
     
     Best regards,
     {settings.app_name} Team
     """
-    
+
+
+def _build_password_reset_email(reset_token: str):
+    """Build the (subject, html, text) parts of the password reset email."""
+    reset_url = f"{settings.frontend_url}/reset-password?token={reset_token}"
+    return (
+        _RESET_SUBJECT,
+        _RESET_HTML_TMPL.format(reset_url=reset_url),
+        _RESET_TEXT_TMPL.format(reset_url=reset_url),
+    )
+
+
+async def send_password_reset_email(email: str, reset_token: str) -> bool:
+    """Send password reset email inline."""
+    subject, html_content, text_content = _build_password_reset_email(reset_token)
+    return await send_email(email, subject, html_content, text_content)
+
+
+async def queue_password_reset_email(email: str, reset_token: str) -> None:
+    """Queue a password reset email for background delivery."""
+    subject, html_content, text_content = _build_password_reset_email(reset_token)
+    await schedule_email(email, subject, html_content, text_content)
+
+
+def _build_verification_email(verification_token: str):
+    """Build the (subject, html, text) parts of the verification email."""
+    verification_url = f"{settings.frontend_url}/verify-email?token={verification_token}"
+    return (
+        _VERIFY_SUBJECT,
+        _VERIFY_HTML_TMPL.format(verification_url=verification_url),
+        _VERIFY_TEXT_TMPL.format(verification_url=verification_url),
+    )
+
+
+async def send_verification_email(email: str, verification_token: str) -> bool:
+    """Send email verification email inline."""
+    subject, html_content, text_content = _build_verification_email(verification_token)
     return await send_email(email, subject, html_content, text_content)
+
+
+async def queue_verification_email(email: str, verification_token: str) -> None:
+    """Queue an email verification email for background delivery."""
+    subject, html_content, text_content = _build_verification_email(verification_token)
+    await schedule_email(email, subject, html_content, text_content)
@@ -0,0 +1,36 @@
+"""User-facing message catalog for English and Swahili responses.
+
+Endpoints previously built each error string with an inline ternary per
+request; keeping the strings in one module-level table interns them once
+and keeps the two languages side by side.
+"""
+
+LANG_DEFAULT = "english"
+
+_MSG = {
+    ("english", "failed_register_child"): "Failed to register child",
+    ("swahili", "failed_register_child"): "Imeshindwa kusajili mtoto",
+    ("english", "failed_fetch_children"): "Failed to fetch children",
+    ("swahili", "failed_fetch_children"): "Imeshindwa kupata watoto",
+    ("english", "failed_create_growth_record"): "Failed to create growth record",
+    ("swahili", "failed_create_growth_record"): "Imeshindwa kutengeneza rekodi ya ukuaji",
+    ("english", "child_not_found"): "Child not found",
+    ("swahili", "child_not_found"): "Mtoto hajapatikana",
+    ("english", "failed_fetch_child_history"): "Failed to fetch child history",
+    ("swahili", "failed_fetch_child_history"): "Imeshindwa kupata historia ya mtoto",
+    ("english", "failed_analyze_trends"): "Failed to analyze growth trends",
+    ("swahili", "failed_analyze_trends"): "Imeshindwa kuchambua mienendo ya ukuaji",
+    ("english", "chatbot_no_answer"): "Unable to generate a proper response. Please try again.",
+    ("swahili", "chatbot_no_answer"): "Imeshindwa kutoa jibu sahihi. Tafadhali jaribu tena.",
+    ("english", "chatbot_error"): "Error processing your question. Please try again.",
+    ("swahili", "chatbot_error"): "Kosa katika kuchakata swali lako. Tafadhali jaribu tena.",
+    ("english", "recommendation_invalid"): "Unable to generate proper recommendations. Please try again.",
+    ("swahili", "recommendation_invalid"): "Imeshindwa kutoa mapendekezo sahihi. Tafadhali jaribu tena.",
+    ("english", "recommendation_error"): "Error generating recommendations. Please try again.",
+    ("swahili", "recommendation_error"): "Kosa katika kutengeneza mapendekezo. Tafadhali jaribu tena.",
+}
+
+
+def t(lang: str, key: str) -> str:
+    """Look up a message for a language, falling back to English."""
+    return _MSG.get((lang, key)) or _MSG[(LANG_DEFAULT, key)]
@@ -4,12 +4,29 @@ from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+except ImportError:  # pragma: no cover - orjson is in requirements.txt
+    DefaultResponse = JSONResponse
+
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:  # pragma: no cover - uvloop is in requirements.txt
+    uvloop = None
+
 from app.core.config import settings
-from app.db.database import create_db_and_tables
+from app.core.revocation_cache import revocation_cache
+from app.crud.user import warm_revocation_cache
+from app.db.database import create_db_and_tables, async_session_maker
+from app.emails.email_sender import start_email_worker, stop_email_worker
 from app.api.auth import router as auth_router
 from app.api.users import router as users_router
 from app.api.ml_predictions import router as ml_router
 from app.api.children import router as children_router
+from app.ml.batcher import prediction_batcher
+from app.ml.chat_worker import chat_worker
 from app.ml.model_loader import ml_models
 
 # Configure logging
@@ -33,15 +50,31 @@ async def lifespan(app: FastAPI):
         # Load ML models
         await ml_models.load_models()
         logger.info("ML models loaded successfully")
-        
+
+        # Warm the in-process token revocation cache and start its sweeper
+        async with async_session_maker() as session:
+            await warm_revocation_cache(session)
+        revocation_cache.start_sweeper()
+
+        # Start the ML prediction micro-batcher and chatbot worker
+        prediction_batcher.start()
+        chat_worker.start()
+
+        # Start background email delivery
+        start_email_worker()
+
     except Exception as e:
         logger.error(f"Failed to initialize application: {e}")
         raise
-    
+
     yield
-    
+
     # Shutdown
     logger.info("Shutting down FastAPI application...")
+    await stop_email_worker()
+    await chat_worker.stop()
+    await prediction_batcher.stop()
+    await revocation_cache.stop_sweeper()
 
 
 # Create FastAPI app
@@ -51,6 +84,8 @@ app = FastAPI(
     description="FastAPI Authentication and User Management API",
     docs_url="/docs" if settings.debug else None,
     redoc_url="/redoc" if settings.debug else None,
+    openapi_url="/openapi.json" if settings.debug else None,
+    default_response_class=DefaultResponse,
     lifespan=lifespan
 )
 
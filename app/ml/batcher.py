@@ -0,0 +1,99 @@
+import asyncio
+import logging
+from typing import Any, Dict, Optional
+
+from app.ml.model_loader import ml_models
+
+logger = logging.getLogger(__name__)
+
+# Batch at most this many pending requests into one model call
+BATCH_MAX = 32
+# How long to wait for more requests to join a batch
+BATCH_WAIT_MS = 5
+
+
+class PredictionBatcher:
+    """Coalesces concurrent prediction requests into batched model calls.
+
+    Tree and linear models are throughput-bound on batch size; stacking
+    the feature vectors of requests that arrive within a few milliseconds
+    into a single predict() amortizes the per-call Python overhead.
+    Results fan back out to callers via per-request futures.
+    """
+
+    def __init__(self, batch_max: int = BATCH_MAX, batch_wait_ms: int = BATCH_WAIT_MS):
+        self.batch_max = batch_max
+        self.batch_wait = batch_wait_ms / 1000.0
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the background batching task (idempotent)."""
+        if not self.running:
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the background batching task."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def submit(self, features: Dict[str, Any]) -> Dict[str, str]:
+        """Submit one feature dict for prediction and await its result."""
+        if not self.running:
+            # No batching loop (e.g. in tests before the lifespan runs):
+            # fall back to a direct off-loop prediction
+            return await asyncio.to_thread(
+                ml_models.predict_malnutrition_risk, features
+            )
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((features, future))
+        return await future
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            # Block for the first request, then collect whatever else
+            # arrives within the batching window
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.batch_wait
+            while len(batch) < self.batch_max:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._queue.get(), timeout)
+                    )
+                except asyncio.TimeoutError:
+                    break
+
+            features_list = [features for features, _ in batch]
+            try:
+                results = await asyncio.to_thread(
+                    ml_models.predict_malnutrition_risk_batch, features_list
+                )
+            except Exception as e:
+                logger.error(f"Batched prediction failed for {len(batch)} requests: {e}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+
+# Global instance started from the application lifespan
+prediction_batcher = PredictionBatcher()
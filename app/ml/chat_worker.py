@@ -0,0 +1,75 @@
+import asyncio
+import logging
+from typing import Optional
+
+from app.ml.model_loader import ml_models
+
+logger = logging.getLogger(__name__)
+
+
+class ChatWorker:
+    """Serializes chatbot inference onto one background worker.
+
+    The chatbot model is not guaranteed to be re-entrant, and hammering
+    it from many pool threads at once just thrashes its caches under the
+    GIL. Requests queue up here and a single loop runs them in arrival
+    order, one off-loop model call at a time, answering each caller
+    through its future.
+    """
+
+    def __init__(self):
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the background worker task (idempotent)."""
+        if not self.running:
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the background worker task."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def submit(self, question: str, language: str) -> str:
+        """Queue one question and await its answer."""
+        if not self.running:
+            # No worker loop (e.g. in tests before the lifespan runs):
+            # fall back to a direct off-loop call
+            return await asyncio.to_thread(
+                ml_models.get_chatbot_answer, question, language
+            )
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((question, language, future))
+        return await future
+
+    async def _run(self) -> None:
+        while True:
+            question, language, future = await self._queue.get()
+            try:
+                answer = await asyncio.to_thread(
+                    ml_models.get_chatbot_answer, question, language
+                )
+            except Exception as e:
+                logger.error(f"Chatbot inference failed: {e}")
+                if not future.done():
+                    future.set_exception(e)
+                continue
+
+            if not future.done():
+                future.set_result(answer)
+
+
+# Global instance started from the application lifespan
+chat_worker = ChatWorker()
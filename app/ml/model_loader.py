@@ -1,12 +1,228 @@
+import asyncio
 import joblib
+import threading
+from collections import OrderedDict
 import logging
+import operator
+import re
 from pathlib import Path
 from typing import Optional, Dict, Any
-import pandas as pd
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# One C-level multi-get for the numeric features, in model input order
+_NUMERIC_FEATURE_GETTER = operator.itemgetter(
+    "Age_Months", "Weight_kg", "Height_cm", "HeadCircumference_cm",
+    "MUAC_cm", "BMI", "Diet_Diversity_Score",
+    "Weight_for_Age_ZScore", "Height_for_Age_ZScore",
+    "BMI_for_Age_ZScore", "MUAC_for_Age_ZScore",
+    "Weight_for_Age_Percentile", "Height_for_Age_Percentile",
+    "BMI_for_Age_Percentile", "MUAC_for_Age_Percentile",
+)
+
+# Columns those numeric features occupy in the 17-wide feature matrix;
+# columns 1 (Sex) and 8 (Recent_Infection) hold the categorical encodings
+_NUMERIC_FEATURE_COLUMNS = np.array(
+    [0, 2, 3, 4, 5, 6, 7, 9, 10, 11, 12, 13, 14, 15, 16]
+)
+
+_FEATURE_WIDTH = 17
+
+# Risk implied by each rule-based status in the fallback classifier
+_STATUS_RISK = {
+    "Severe": "High Risk",
+    "Stunting": "At Risk",
+    "Underweight": "At Risk",
+    "Overweight": "At Risk",
+}
+
+# Representative input used to warm the prediction path after loading
+_WARMUP_FEATURES = {
+    "Age_Months": 24, "Sex": "Male", "Weight_kg": 12.0, "Height_cm": 86.0,
+    "HeadCircumference_cm": 48.0, "MUAC_cm": 14.5, "BMI": 16.2,
+    "Diet_Diversity_Score": 5, "Recent_Infection": "No",
+    "Weight_for_Age_ZScore": 0.0, "Height_for_Age_ZScore": 0.0,
+    "BMI_for_Age_ZScore": 0.0, "MUAC_for_Age_ZScore": 0.0,
+    "Weight_for_Age_Percentile": 50.0, "Height_for_Age_Percentile": 50.0,
+    "BMI_for_Age_Percentile": 50.0, "MUAC_for_Age_Percentile": 50.0,
+}
+
+# Most repeated chatbot questions are FAQ-style; cap the answer cache so
+# it stays a bounded in-process LRU
+_ANSWER_CACHE_MAX = 1024
+
+# Static fallback recommendations, keyed (status, risk), defined once at
+# module load instead of being rebuilt inside every fallback call
+_FALLBACK_RECOMMENDATIONS = {
+    "swahili": {
+        ("Normal", "No Risk"): 
+            "Mtoto wako anakua vizuri! Endelea kumpa vyakula vya usawa pamoja na matunda, mboga, nafaka, na protini. "
+            "Tunza nyakati za kawaida za chakula na uhakikishe mazoezi ya kutosha ya kimwili. Tembelea kliniki kwa uchunguzi wa kawaida ili kudumisha ukuaji mzuri.",
+        
+        ("Stunting", "At Risk"):
+            "Mtoto wako anaonyesha dalili za udogo ambao unaathiri ukuazi wa urefu. Mpe vyakula vyenye protini nyingi kama maharagwe, karanga, mayai, maziwa, na samaki. "
+            "Jumuisha vyakula vyenye chuma na matunda kwa vitamini. Tafadhali tembelea kliniki haraka kwa ufuatiliaji wa ukuaji na ushauri wa lishe.",
+        
+        ("Stunting", "High Risk"):
+            "Mtoto wako ana udogo mkubwa unaohitaji umakini wa haraka. Ongeza ulaji wa protini kwa maharagwe, nyama, mayai, na maziwa kila siku. "
+            "Ongeza vyakula vyenye virutubisho vingi na fikiria programu za kulisha za matibabu. Tembelea kliniki haraka kwa utunzaji maalum na ufuatiliaji.",
+        
+        ("Underweight", "At Risk"):
+            "Mtoto wako ana uzito mdogo na anahitaji chakula chenye lishe zaidi. Ongeza vyakula vyenye kalori nyingi kama karanga, parachichi, na mafuta ya kupikia katika vyakula. "
+            "Mpe vyakula vidogo vya mara kwa mara vyenye protini na mafuta mazuri. Tafadhali tembelea kliniki kwa tathmini ya ukuaji na mwongozo wa kulisha.",
+        
+        ("Underweight", "High Risk"):
+            "Mtoto wako ana upungufu mkubwa wa uzito na anahitaji uingiliaji kazi wa haraka. Ongeza mzunguko wa chakula na ongeza vyakula vya nishati ya juu kila siku. "
+            "Jumuisha vyakula vya matibabu ikiwa vinapatikana na uhakikishe matibabu ya maambukizi yoyote. Tembelea kituo cha afya haraka kwa utunzaji maalum.",
+        
+        ("Overweight", "At Risk"):
+            "Mtoto wako ana uzito mkubwa ambao unaweza kuathiri maendeleo mazuri. Punguza vyakula vyenye sukari na ongeza matunda na mboga. "
+            "Himiza mchezo mkuu na punguza wakati wa kuketi. Tembelea kliniki kwa tathmini sahihi na mwongozo wa tabia za kula nzuri.",
+        
+        ("Overweight", "High Risk"):
+            "Mtoto wako ana uzito mkubwa unaohitaji usimamizi makini. Zingatia vyakula vyenye lishe, vyenye usawa bila sukari au mafuta mengi. "
+            "Ongeza mazoezi ya kimwili kupitia mchezo na michezo. Tafadhali tembelea kliniki kwa tathmini ya kina na mpango wa usimamizi wa uzito.",
+        
+        ("Severe", "High Risk"):
+            "Mtoto wako ana utapiamlo mkubwa unaohitaji umakini wa matibabu wa haraka. Hii ni hali mbaya inayohitaji matibabu ya haraka. "
+            "Tembelea hospitali au kliniki mara moja kwa huduma za dharura. Fuata ushauri wote wa kimatibabu na itifaki za kulisha za matibabu kwa ukali."
+    },
+    "english": {
+        ("Normal", "No Risk"): 
+            "Your child is growing well! Continue providing balanced meals with fruits, vegetables, grains, and proteins. "
+            "Keep regular meal times and ensure adequate physical activity. Visit the clinic for routine check-ups to maintain healthy growth.",
+        
+        ("Stunting", "At Risk"):
+            "Your child shows signs of stunting which affects height growth. Provide protein-rich foods like beans, groundnuts, eggs, milk, and fish. "
+            "Include iron-rich foods and fruits for vitamins. Please visit the clinic immediately for growth monitoring and nutritional counseling.",
+        
+        ("Stunting", "High Risk"):
+            "Your child has severe stunting requiring urgent attention. Increase protein intake with beans, meat, eggs, and milk daily. "
+            "Add nutrient-dense foods and consider therapeutic feeding programs. Visit the clinic urgently for specialized care and monitoring.",
+        
+        ("Underweight", "At Risk"):
+            "Your child is underweight and needs more nutritious food. Add calorie-dense foods like groundnuts, avocados, and cooking oil to meals. "
+            "Provide frequent small meals with proteins and healthy fats. Please visit the clinic for growth assessment and feeding guidance.",
+        
+        ("Underweight", "High Risk"):
+            "Your child is severely underweight and needs immediate intervention. Increase meal frequency and add high-energy foods daily. "
+            "Include therapeutic foods if available and ensure treatment for any infections. Visit the health facility urgently for specialized care.",
+        
+        ("Overweight", "At Risk"):
+            "Your child is overweight which can affect healthy development. Reduce sugary foods and increase fruits and vegetables. "
+            "Encourage active play and limit sedentary time. Visit the clinic for proper assessment and guidance on healthy eating habits.",
+        
+        ("Overweight", "High Risk"):
+            "Your child has significant overweight requiring careful management. Focus on nutritious, balanced meals without excess sugars or fats. "
+            "Increase physical activity through play and sports. Please visit the clinic for comprehensive evaluation and weight management plan.",
+        
+        ("Severe", "High Risk"):
+            "Your child has severe malnutrition requiring immediate medical attention. This is a serious condition that needs urgent treatment. "
+            "Visit the hospital or clinic immediately for emergency care. Follow all medical advice and therapeutic feeding protocols strictly."
+    },
+}
+
+_DEFAULT_RECOMMENDATION = {
+    "swahili": (
+        "Kulingana na hali ya lishe ya mtoto wako, tafadhali mpe vyakula vya usawa vyenye protini, matunda, na mboga. "
+        "Tembelea kliniki ya karibu kwa tathmini sahihi na mwongozo binafsi kuhusu lishe na ukuaji wa mtoto wako."
+    ),
+    "english": (
+        "Based on your child's nutritional status, please provide balanced meals with proteins, fruits, and vegetables. "
+        "Visit your local clinic for proper assessment and personalized guidance on your child's nutrition and growth."
+    ),
+}
+
+
+_WORD_RE = re.compile(r"[a-z]+")
+
+# Topic keyword sets for the fallback chatbot, checked in order; the
+# question is tokenized once and matched with C-level set intersection
+_CHATBOT_TOPIC_KEYWORDS = (
+    ("nutrition", frozenset({"feed", "food", "eat", "nutrition", "chakula", "kula", "ulaji", "lishe"})),
+    ("growth", frozenset({"growth", "develop", "milestone", "ukuaji", "maendeleo", "kukua"})),
+    ("play", frozenset({"play", "game", "activity", "toy", "mchezo", "kucheza", "shughuli", "michezo"})),
+    ("health", frozenset({"health", "sick", "fever", "cough", "afya", "mgonjwa", "homa", "kikohozi"})),
+    ("size", frozenset({"weight", "height", "size", "uzito", "urefu", "ukubwa"})),
+    ("sleep", frozenset({"sleep", "tired", "rest", "usingizi", "kulala", "uchovu"})),
+)
+
+# Tanzania-specific fallback answers, keyed (topic, language)
+_CHATBOT_FALLBACK_ANSWERS = {
+    ("nutrition", "swahili"): (
+        "Kwa ukuaji mzuri, mpe mtoto wako aina mbalimbali za vyakula ikiwa ni pamoja na matunda, mboga, nafaka, protini kama maharagwe au mayai, na mazao ya maziwa. "
+        "Hakikisha chakula ni cha kawaida na kinafaa kwa umri. Kunyonyesha ni muhimu kwa watoto chini ya miaka 2. "
+        "Ongea na mtoa huduma za afya kwa ushauri maalum wa lishe."
+    ),
+    ("nutrition", "english"): (
+        "For healthy growth, feed your child a variety of foods including fruits, vegetables, grains, proteins like beans or eggs, and dairy products. "
+        "Ensure meals are regular and age-appropriate. Breastfeeding is important for babies under 2 years. "
+        "Consult your healthcare provider for specific dietary guidance."
+    ),
+    ("growth", "swahili"): (
+        "Kila mtoto anakua kwa kasi yake, lakini uchunguzi wa kawaida ni muhimu. "
+        "Hakikisha lishe nzuri, usingizi wa kutosha, na kushiriki katika michezo inayofaa kwa umri. "
+        "Fuatilia hatua muhimu za maendeleo na ongea na mtoa huduma za afya kama una wasiwasi kuhusu maendeleo ya mtoto wako."
+    ),
+    ("growth", "english"): (
+        "Each child develops at their own pace, but regular check-ups are important. "
+        "Ensure good nutrition, adequate sleep, and engage in age-appropriate play activities. "
+        "Monitor key milestones and consult your healthcare provider if you have concerns about your child's development."
+    ),
+    ("play", "swahili"): (
+        "Mchezo ni muhimu kwa maendeleo ya mtoto. Kwa watoto wadogo, tumia vitu salama vya kuchezea na michezo rahisi ya mikono. "
+        "Kwa watoto wakubwa, chagua michezo inayosaidia maendeleo ya akili na mwili kama kukimbia, kuruka, na michezo ya kujifunza. "
+        "Hakikisha mazingira ya mchezo ni salama na yanashirikishwa na wazazi."
+    ),
+    ("play", "english"): (
+        "Play is essential for child development. For toddlers, use safe toys and simple hand games. "
+        "For older children, choose activities that promote physical and mental development like running, jumping, and educational games. "
+        "Ensure play environments are safe and involve parent interaction."
+    ),
+    ("health", "swahili"): (
+        "Kwa afya nzuri ya mtoto, hakikisha chanjo za wakati, lishe bora, na usafi. "
+        "Kama mtoto ana dalili za ugonjwa kama homa, kikohozi, au kutokula, mpe maji mengi na mchunge kwa karibu. "
+        "Tembelea kituo cha afya haraka kama dalili zitaendelea au zitakuwa mbaya zaidi."
+    ),
+    ("health", "english"): (
+        "For good child health, ensure timely vaccinations, proper nutrition, and hygiene. "
+        "If your child shows signs of illness like fever, cough, or loss of appetite, provide plenty of fluids and monitor closely. "
+        "Visit a health facility promptly if symptoms persist or worsen."
+    ),
+    ("size", "swahili"): (
+        "Ufuatiliaji wa ukuaji wa kawaida ni muhimu kwa watoto. Tumia chati za ukuaji na tembelea mtoa huduma za afya mara kwa mara. "
+        "Zingatia lishe iliyosawazishwa, mazoezi yanayofaa kwa umri, na mapumziko ya kutosha. "
+        "Wasiliana na mtoa huduma za afya kama mifumo ya ukuaji inaonekana kuwa na wasiwasi."
+    ),
+    ("size", "english"): (
+        "Regular growth monitoring is essential for children. Use growth charts and visit your healthcare provider regularly. "
+        "Focus on balanced nutrition, age-appropriate physical activity, and adequate rest. "
+        "Contact your healthcare provider if growth patterns seem concerning."
+    ),
+    ("sleep", "swahili"): (
+        "Usingizi wa kutosha ni muhimu kwa ukuaji na maendeleo. Watoto wadogo wanahitaji masaa 10-14 ya usingizi kwa siku. "
+        "Tengeneza ratiba ya usingizi na mazingira ya utulivu. Epuka kucheza mchezo mkubwa kabla ya kulala. "
+        "Kama mtoto anashida za kulala, jaribu michezo ya utulivu na hadithi kabla ya kulala."
+    ),
+    ("sleep", "english"): (
+        "Adequate sleep is crucial for growth and development. Young children need 10-14 hours of sleep per day. "
+        "Establish a sleep routine and calm environment. Avoid active play before bedtime. "
+        "If your child has sleep difficulties, try quiet activities and bedtime stories."
+    ),
+    ("general", "swahili"): (
+        "Kwa utunzaji bora wa mtoto wako, hakikisha lishe bora na vyakula mbalimbali, uchunguzi wa kimatibabu wa kawaida, na shughuli zinazofaa kwa umri. "
+        "Kila mtoto ni wa kipekee, kwa hiyo ongea na mtoa huduma za afya kwa ushauri binafsi kuhusu afya na maendeleo ya mtoto wako. "
+        "Tunza ratiba ya chanjo na tafuta msaada wa kitaalamu inapohitajika."
+    ),
+    ("general", "english"): (
+        "For the best care of your child, ensure proper nutrition with diverse foods, regular medical check-ups, and age-appropriate activities. "
+        "Each child is unique, so consult with your healthcare provider for personalized advice about your child's health and development. "
+        "Maintain vaccination schedules and seek professional help when needed."
+    ),
+}
+
+
 class MLModels:
     """ML model loader and predictor service."""
     
@@ -27,47 +243,173 @@ class MLModels:
         
         self.risk_labels = {
             0: "No Risk",
-            1: "At Risk", 
+            1: "At Risk",
             2: "High Risk"
         }
+
+        # Inverse label maps, built once so request paths don't rebuild them
+        self._malnutrition_codes = {v: k for k, v in self.malnutrition_labels.items()}
+        self._risk_codes = {v: k for k, v in self.risk_labels.items()}
+
+        # Positional label tables for decoding model output codes: a tuple
+        # index beats a dict probe on the per-prediction path
+        self._malnutrition_tbl = tuple(
+            self.malnutrition_labels[i] for i in range(len(self.malnutrition_labels))
+        )
+        self._risk_tbl = tuple(
+            self.risk_labels[i] for i in range(len(self.risk_labels))
+        )
+
+        # Flattened fallback recommendation tables indexed by
+        # mal_code * len(risk) + risk_code; holes stay None and fall back
+        # to the per-language default
+        self._rec_table = {
+            lang: tuple(
+                table.get((status, risk))
+                for status in self._malnutrition_tbl
+                for risk in self._risk_tbl
+            )
+            for lang, table in _FALLBACK_RECOMMENDATIONS.items()
+        }
+
+        # The chatbot model is loaded lazily on first question instead of
+        # at startup; the lock keeps concurrent first calls from both loading
+        self._chatbot_loaded = False
+        self._chatbot_lock = threading.Lock()
+
+        # Per-model invokers, resolved once at load time so request paths
+        # don't repeat the hasattr interface sniffing on every call
+        self._chatbot_invoke = None
+        self._prediction_invoke = None
+        self._recommendation_invoke = None
+
+        # Recommendations are a pure function of (status, risk, language) —
+        # at most a few dozen combinations — so outputs are memoized here
+        self._recommendation_cache: Dict[tuple, str] = {}
+
+        # LRU of chatbot answers keyed (question, language); repeat FAQ
+        # questions skip inference entirely
+        self._answer_cache: OrderedDict = OrderedDict()
+        self._answer_cache_lock = threading.Lock()
     
     async def load_models(self) -> None:
-        """Load all ML models at startup."""
+        """Load all ML models at startup.
+
+        Models are loaded with mmap_mode="r" so the NumPy arrays inside
+        (e.g. ensemble trees) are memory-mapped read-only; multiple worker
+        processes then share the same OS page-cache pages instead of each
+        holding a private copy.
+        """
+        async def _load(path: Path) -> Optional[Any]:
+            if not path.exists():
+                logger.warning(f"Model not found at {path}")
+                return None
+            return await asyncio.to_thread(joblib.load, path, mmap_mode="r")
+
         try:
-            # Load chatbot model
-            chatbot_path = self.models_dir / "chatbot_model.pkl"
-            if chatbot_path.exists():
-                self.chatbot_model = joblib.load(chatbot_path)
-                logger.info("Chatbot model loaded successfully")
-            else:
-                logger.warning(f"Chatbot model not found at {chatbot_path}")
-            
-            # Load prediction model
-            prediction_path = self.models_dir / "prediction_model.pkl"
-            if prediction_path.exists():
-                self.prediction_model = joblib.load(prediction_path)
+            # The chatbot model is deferred to first use (it is the largest
+            # of the three and not needed to serve predictions). The other
+            # two load concurrently so startup pays max(load) not sum(load)
+            self.prediction_model, self.recommendation_model = await asyncio.gather(
+                _load(self.models_dir / "prediction_model.pkl"),
+                _load(self.models_dir / "recommendation_model.pkl"),
+            )
+            if self.prediction_model is not None:
+                self._prediction_invoke = self._resolve_prediction_invoker(
+                    self.prediction_model
+                )
                 logger.info("Prediction model loaded successfully")
-            else:
-                logger.warning(f"Prediction model not found at {prediction_path}")
-            
-            # Load recommendation model
-            recommendation_path = self.models_dir / "recommendation_model.pkl"
-            if recommendation_path.exists():
-                self.recommendation_model = joblib.load(recommendation_path)
+            if self.recommendation_model is not None:
+                self._recommendation_invoke = self._resolve_recommendation_invoker(
+                    self.recommendation_model
+                )
                 logger.info("Recommendation model loaded successfully")
-            else:
-                logger.warning(f"Recommendation model not found at {recommendation_path}")
-                
+
+            # Drop memoized outputs computed before (re)loading
+            self._recommendation_cache.clear()
+            with self._answer_cache_lock:
+                self._answer_cache.clear()
+
+            # Warm the inference path so the first real request doesn't pay
+            # deferred imports, estimator lazy init and BLAS pool spin-up
+            await asyncio.to_thread(self._warmup)
+
         except Exception as e:
             logger.error(f"Error loading models: {e}")
             raise
     
+    @staticmethod
+    def _resolve_chatbot_invoker(model):
+        """Pick the model's answer entry point once, at load time."""
+        if hasattr(model, 'predict'):
+            return lambda question: model.predict([question])[0]
+        if hasattr(model, 'get_answer'):
+            return model.get_answer
+        if callable(model):
+            return model
+        # Fallback to simple predict
+        return lambda question: str(model.predict([question]))
+
+    @staticmethod
+    def _resolve_prediction_invoker(model):
+        """Pick the model's prediction entry point once, at load time."""
+        return model.predict if hasattr(model, 'predict') else model
+
+    @staticmethod
+    def _resolve_recommendation_invoker(model):
+        """Pick the model's recommendation entry point once, at load time."""
+        if hasattr(model, 'predict'):
+            return lambda input_data: model.predict([input_data])[0]
+        if hasattr(model, 'get_recommendation'):
+            return model.get_recommendation
+        return model
+
+    def _warmup(self) -> None:
+        """Run one dummy inference per loaded model to absorb first-call costs."""
+        try:
+            if self.prediction_model is not None:
+                self.predict_malnutrition_risk(dict(_WARMUP_FEATURES))
+            if self.recommendation_model is not None:
+                self.get_recommendation("Normal", "No Risk", "english")
+        except Exception as e:
+            logger.warning(f"Model warmup failed: {e}")
+
+    def _ensure_chatbot_model(self) -> None:
+        """Load the chatbot model on first use (idempotent, thread-safe)."""
+        if self._chatbot_loaded:
+            return
+        with self._chatbot_lock:
+            if self._chatbot_loaded:
+                return
+            chatbot_path = self.models_dir / "chatbot_model.pkl"
+            if chatbot_path.exists():
+                self.chatbot_model = joblib.load(chatbot_path, mmap_mode="r")
+                self._chatbot_invoke = self._resolve_chatbot_invoker(
+                    self.chatbot_model
+                )
+                logger.info("Chatbot model loaded successfully")
+            else:
+                logger.warning(f"Chatbot model not found at {chatbot_path}")
+            self._chatbot_loaded = True
+
     def get_chatbot_answer(self, question: str, language: str = "english") -> str:
-        """Get answer from chatbot model with language support."""
+        """Get answer from chatbot model with language support.
+
+        Model answers are cached in a bounded LRU keyed on the exact
+        (question, language) pair, since FAQ-style questions repeat often.
+        """
+        self._ensure_chatbot_model()
         if self.chatbot_model is None:
             # Fallback responses for when model is not available
             return self._get_fallback_chatbot_answer(question, language)
-        
+
+        cache_key = (question, language)
+        with self._answer_cache_lock:
+            answer = self._answer_cache.get(cache_key)
+            if answer is not None:
+                self._answer_cache.move_to_end(cache_key)
+                return answer
+
         try:
             # Prepare input with language context for fine-tuned model
             if language == "swahili":
@@ -77,18 +419,17 @@ class MLModels:
                 # Default to English
                 contextualized_question = f"Answer in English: {question}"
             
-            # Use the fine-tuned model's native language capabilities
-            if hasattr(self.chatbot_model, 'predict'):
-                answer = self.chatbot_model.predict([contextualized_question])[0]
-            elif hasattr(self.chatbot_model, 'get_answer'):
-                answer = self.chatbot_model.get_answer(contextualized_question)
-            elif hasattr(self.chatbot_model, '__call__'):
-                answer = self.chatbot_model(contextualized_question)
-            else:
-                # Fallback to simple predict
-                answer = str(self.chatbot_model.predict([contextualized_question]))
+            # Use the fine-tuned model's native language capabilities via
+            # the invoker resolved at load time
+            answer = self._chatbot_invoke(contextualized_question)
             
-            return str(answer)
+            answer = str(answer)
+            with self._answer_cache_lock:
+                self._answer_cache[cache_key] = answer
+                self._answer_cache.move_to_end(cache_key)
+                while len(self._answer_cache) > _ANSWER_CACHE_MAX:
+                    self._answer_cache.popitem(last=False)
+            return answer
             
         except Exception as e:
             logger.error(f"Error in chatbot prediction: {e}")
@@ -102,13 +443,10 @@ class MLModels:
         
         try:
             # Prepare features for prediction
-            feature_vector = self._prepare_prediction_features(features)
+            feature_matrix = self._prepare_prediction_matrix([features])
             
-            # Make prediction
-            if hasattr(self.prediction_model, 'predict'):
-                predictions = self.prediction_model.predict([feature_vector])
-            else:
-                predictions = self.prediction_model([feature_vector])
+            # Make prediction via the invoker resolved at load time
+            predictions = self._prediction_invoke(feature_matrix)
             
             # Handle different prediction formats
             if isinstance(predictions, (list, tuple)) and len(predictions) >= 2:
@@ -124,84 +462,118 @@ class MLModels:
                 risk_pred = self._infer_risk_from_malnutrition(pred_value)
             
             # Map predictions to labels
-            malnutrition_status = self.malnutrition_labels.get(int(malnutrition_pred), "Normal")
-            developmental_risk = self.risk_labels.get(int(risk_pred), "No Risk")
-            
             return {
-                "malnutrition_status": malnutrition_status,
-                "developmental_risk": developmental_risk
+                "malnutrition_status": self._decode_malnutrition(malnutrition_pred),
+                "developmental_risk": self._decode_risk(risk_pred)
             }
             
         except Exception as e:
             logger.error(f"Error in malnutrition prediction: {e}")
             return self._get_fallback_prediction(features)
     
+    def predict_malnutrition_risk_batch(self, features_list: list) -> list:
+        """Predict malnutrition status and risk for a batch of feature dicts."""
+        if self.prediction_model is None:
+            return [self._get_fallback_prediction(f) for f in features_list]
+
+        try:
+            feature_matrix = self._prepare_prediction_matrix(features_list)
+            predictions = self._prediction_invoke(feature_matrix)
+
+            results = []
+            for row in predictions:
+                if hasattr(row, "__len__") and not isinstance(row, str) and len(row) >= 2:
+                    malnutrition_pred, risk_pred = row[0], row[1]
+                else:
+                    malnutrition_pred = row
+                    risk_pred = self._infer_risk_from_malnutrition(malnutrition_pred)
+
+                results.append({
+                    "malnutrition_status": self._decode_malnutrition(malnutrition_pred),
+                    "developmental_risk": self._decode_risk(risk_pred)
+                })
+            return results
+
+        except Exception as e:
+            logger.error(f"Error in batched malnutrition prediction: {e}")
+            return [self._get_fallback_prediction(f) for f in features_list]
+
     def get_recommendation(self, malnutrition_status: str, developmental_risk: str, language: str = "english") -> str:
-        """Get nutrition and developmental recommendations with language support."""
+        """Get nutrition and developmental recommendations with language support.
+
+        Results are memoized per (status, risk, language): the input space is
+        tiny and discrete, so repeat requests become a dict lookup instead of
+        a model call.
+        """
+        cache_key = (malnutrition_status, developmental_risk, language)
+        cached = self._recommendation_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         if self.recommendation_model is None:
             return self._get_fallback_recommendation(malnutrition_status, developmental_risk, language)
-        
+
+        # The model is English-trained; Swahili requests are served from the
+        # curated Swahili table keyed on the same status pair, without ever
+        # invoking the model
+        if language == "swahili":
+            recommendation_text = self._get_fallback_recommendation(
+                malnutrition_status, developmental_risk, "swahili"
+            )
+            self._recommendation_cache[cache_key] = recommendation_text
+            return recommendation_text
+
         try:
             # Prepare input for recommendation model (English-trained)
             input_data = self._prepare_recommendation_input(malnutrition_status, developmental_risk)
-            
-            # Make recommendation (model returns English)
-            if hasattr(self.recommendation_model, 'predict'):
-                recommendation = self.recommendation_model.predict([input_data])[0]
-            elif hasattr(self.recommendation_model, 'get_recommendation'):
-                recommendation = self.recommendation_model.get_recommendation(input_data)
-            else:
-                recommendation = self.recommendation_model(input_data)
-            
-            # Since model is English-trained, use fallback for Swahili translation if needed
-            english_recommendation = str(recommendation)
-            
-            # If user wants Swahili, translate the English recommendation
-            if language == "swahili":
-                return self._translate_recommendation_to_swahili(english_recommendation, malnutrition_status, developmental_risk)
+
+            # Make recommendation (model returns English) via the invoker
+            # resolved at load time
+            recommendation = self._recommendation_invoke(input_data)
+
+            if isinstance(recommendation, str):
+                recommendation_text = recommendation
             else:
-                return english_recommendation
-            
+                recommendation_text = str(recommendation)
+
+            self._recommendation_cache[cache_key] = recommendation_text
+            return recommendation_text
+
         except Exception as e:
             logger.error(f"Error in recommendation generation: {e}")
             return self._get_fallback_recommendation(malnutrition_status, developmental_risk, language)
     
-    def _prepare_prediction_features(self, features: Dict[str, Any]) -> list:
-        """Prepare features for prediction model."""
-        # Convert categorical features
-        sex_encoded = 1 if features["Sex"] == "Male" else 0
-        infection_encoded = 1 if features["Recent_Infection"] == "Yes" else 0
-        
-        # Create feature vector in expected order
-        feature_vector = [
-            features["Age_Months"],
-            sex_encoded,
-            features["Weight_kg"],
-            features["Height_cm"],
-            features["HeadCircumference_cm"],
-            features["MUAC_cm"],
-            features["BMI"],
-            features["Diet_Diversity_Score"],
-            infection_encoded,
-            features["Weight_for_Age_ZScore"],
-            features["Height_for_Age_ZScore"],
-            features["BMI_for_Age_ZScore"],
-            features["MUAC_for_Age_ZScore"],
-            features["Weight_for_Age_Percentile"],
-            features["Height_for_Age_Percentile"],
-            features["BMI_for_Age_Percentile"],
-            features["MUAC_for_Age_Percentile"]
-        ]
-        
-        return feature_vector
+    def _decode_malnutrition(self, pred) -> str:
+        """Map a model output code (possibly a numpy scalar) to its label."""
+        code = int(pred)
+        return self._malnutrition_tbl[code] if 0 <= code < len(self._malnutrition_tbl) else "Normal"
+
+    def _decode_risk(self, pred) -> str:
+        """Map a risk output code (possibly a numpy scalar) to its label."""
+        code = int(pred)
+        return self._risk_tbl[code] if 0 <= code < len(self._risk_tbl) else "No Risk"
+
+    def _prepare_prediction_matrix(self, features_list: list) -> np.ndarray:
+        """Assemble feature dicts into the model's (n, 17) input matrix.
+
+        Fills a preallocated float32 array directly: one itemgetter call
+        per row for the numeric features plus branchless encodings for the
+        two categoricals, instead of building intermediate Python lists.
+        """
+        matrix = np.empty((len(features_list), _FEATURE_WIDTH), dtype=np.float32)
+        for i, features in enumerate(features_list):
+            matrix[i, _NUMERIC_FEATURE_COLUMNS] = _NUMERIC_FEATURE_GETTER(features)
+            matrix[i, 1] = features["Sex"] == "Male"
+            matrix[i, 8] = features["Recent_Infection"] == "Yes"
+        return matrix
     
     def _prepare_recommendation_input(self, malnutrition_status: str, developmental_risk: str) -> list:
         """Prepare input for recommendation model."""
-        # Encode categorical inputs
-        malnutrition_encoded = {v: k for k, v in self.malnutrition_labels.items()}[malnutrition_status]
-        risk_encoded = {v: k for k, v in self.risk_labels.items()}[developmental_risk]
-        
-        return [malnutrition_encoded, risk_encoded]
+        # Encode categorical inputs via the precomputed inverse maps
+        return [
+            self._malnutrition_codes[malnutrition_status],
+            self._risk_codes[developmental_risk]
+        ]
     
     def _infer_risk_from_malnutrition(self, malnutrition_pred: int) -> int:
         """Infer developmental risk from malnutrition status."""
@@ -214,84 +586,16 @@ class MLModels:
     
     def _get_fallback_chatbot_answer(self, question: str, language: str = "english") -> str:
         """Fallback answers when chatbot model is unavailable - Tanzania specific."""
-        question_lower = question.lower()
-        
-        # Nutrition/Feeding questions
-        if any(word in question_lower for word in ["feed", "food", "eat", "nutrition", "chakula", "kula", "ulaji", "lishe"]):
-            if language == "swahili":
-                return ("Kwa ukuaji mzuri, mpe mtoto wako aina mbalimbali za vyakula ikiwa ni pamoja na matunda, mboga, nafaka, protini kama maharagwe au mayai, na mazao ya maziwa. "
-                       "Hakikisha chakula ni cha kawaida na kinafaa kwa umri. Kunyonyesha ni muhimu kwa watoto chini ya miaka 2. "
-                       "Ongea na mtoa huduma za afya kwa ushauri maalum wa lishe.")
-            else:
-                return ("For healthy growth, feed your child a variety of foods including fruits, vegetables, grains, proteins like beans or eggs, and dairy products. "
-                       "Ensure meals are regular and age-appropriate. Breastfeeding is important for babies under 2 years. "
-                       "Consult your healthcare provider for specific dietary guidance.")
-        
-        # Growth/Development questions
-        elif any(word in question_lower for word in ["growth", "develop", "milestone", "ukuaji", "maendeleo", "kukua"]):
-            if language == "swahili":
-                return ("Kila mtoto anakua kwa kasi yake, lakini uchunguzi wa kawaida ni muhimu. "
-                       "Hakikisha lishe nzuri, usingizi wa kutosha, na kushiriki katika michezo inayofaa kwa umri. "
-                       "Fuatilia hatua muhimu za maendeleo na ongea na mtoa huduma za afya kama una wasiwasi kuhusu maendeleo ya mtoto wako.")
-            else:
-                return ("Each child develops at their own pace, but regular check-ups are important. "
-                       "Ensure good nutrition, adequate sleep, and engage in age-appropriate play activities. "
-                       "Monitor key milestones and consult your healthcare provider if you have concerns about your child's development.")
-        
-        # Playing/Activities questions
-        elif any(word in question_lower for word in ["play", "game", "activity", "toy", "mchezo", "kucheza", "shughuli", "michezo"]):
-            if language == "swahili":
-                return ("Mchezo ni muhimu kwa maendeleo ya mtoto. Kwa watoto wadogo, tumia vitu salama vya kuchezea na michezo rahisi ya mikono. "
-                       "Kwa watoto wakubwa, chagua michezo inayosaidia maendeleo ya akili na mwili kama kukimbia, kuruka, na michezo ya kujifunza. "
-                       "Hakikisha mazingira ya mchezo ni salama na yanashirikishwa na wazazi.")
-            else:
-                return ("Play is essential for child development. For toddlers, use safe toys and simple hand games. "
-                       "For older children, choose activities that promote physical and mental development like running, jumping, and educational games. "
-                       "Ensure play environments are safe and involve parent interaction.")
-        
-        # Health questions
-        elif any(word in question_lower for word in ["health", "sick", "fever", "cough", "afya", "mgonjwa", "homa", "kikohozi"]):
-            if language == "swahili":
-                return ("Kwa afya nzuri ya mtoto, hakikisha chanjo za wakati, lishe bora, na usafi. "
-                       "Kama mtoto ana dalili za ugonjwa kama homa, kikohozi, au kutokula, mpe maji mengi na mchunge kwa karibu. "
-                       "Tembelea kituo cha afya haraka kama dalili zitaendelea au zitakuwa mbaya zaidi.")
-            else:
-                return ("For good child health, ensure timely vaccinations, proper nutrition, and hygiene. "
-                       "If your child shows signs of illness like fever, cough, or loss of appetite, provide plenty of fluids and monitor closely. "
-                       "Visit a health facility promptly if symptoms persist or worsen.")
-        
-        # Weight/Size questions  
-        elif any(word in question_lower for word in ["weight", "height", "size", "uzito", "urefu", "ukubwa"]):
-            if language == "swahili":
-                return ("Ufuatiliaji wa ukuaji wa kawaida ni muhimu kwa watoto. Tumia chati za ukuaji na tembelea mtoa huduma za afya mara kwa mara. "
-                       "Zingatia lishe iliyosawazishwa, mazoezi yanayofaa kwa umri, na mapumziko ya kutosha. "
-                       "Wasiliana na mtoa huduma za afya kama mifumo ya ukuaji inaonekana kuwa na wasiwasi.")
-            else:
-                return ("Regular growth monitoring is essential for children. Use growth charts and visit your healthcare provider regularly. "
-                       "Focus on balanced nutrition, age-appropriate physical activity, and adequate rest. "
-                       "Contact your healthcare provider if growth patterns seem concerning.")
-        
-        # Sleep questions
-        elif any(word in question_lower for word in ["sleep", "tired", "rest", "usingizi", "kulala", "uchovu"]):
-            if language == "swahili":
-                return ("Usingizi wa kutosha ni muhimu kwa ukuaji na maendeleo. Watoto wadogo wanahitaji masaa 10-14 ya usingizi kwa siku. "
-                       "Tengeneza ratiba ya usingizi na mazingira ya utulivu. Epuka kucheza mchezo mkubwa kabla ya kulala. "
-                       "Kama mtoto anashida za kulala, jaribu michezo ya utulivu na hadithi kabla ya kulala.")
-            else:
-                return ("Adequate sleep is crucial for growth and development. Young children need 10-14 hours of sleep per day. "
-                       "Establish a sleep routine and calm environment. Avoid active play before bedtime. "
-                       "If your child has sleep difficulties, try quiet activities and bedtime stories.")
-        
-        # General parenting
-        else:
-            if language == "swahili":
-                return ("Kwa utunzaji bora wa mtoto wako, hakikisha lishe bora na vyakula mbalimbali, uchunguzi wa kimatibabu wa kawaida, na shughuli zinazofaa kwa umri. "
-                       "Kila mtoto ni wa kipekee, kwa hiyo ongea na mtoa huduma za afya kwa ushauri binafsi kuhusu afya na maendeleo ya mtoto wako. "
-                       "Tunza ratiba ya chanjo na tafuta msaada wa kitaalamu inapohitajika.")
-            else:
-                return ("For the best care of your child, ensure proper nutrition with diverse foods, regular medical check-ups, and age-appropriate activities. "
-                       "Each child is unique, so consult with your healthcare provider for personalized advice about your child's health and development. "
-                       "Maintain vaccination schedules and seek professional help when needed.")
+        tokens = set(_WORD_RE.findall(question.lower()))
+
+        topic = "general"
+        for name, keywords in _CHATBOT_TOPIC_KEYWORDS:
+            if tokens & keywords:
+                topic = name
+                break
+
+        lang = "swahili" if language == "swahili" else "english"
+        return _CHATBOT_FALLBACK_ANSWERS[(topic, lang)]
     
     def _get_fallback_prediction(self, features: Dict[str, Any]) -> Dict[str, str]:
         """Fallback prediction based on simple rules."""
@@ -312,106 +616,23 @@ class MLModels:
             malnutrition_status = "Normal"
         
         # Determine risk based on status
-        if malnutrition_status in ["Severe"]:
-            developmental_risk = "High Risk"
-        elif malnutrition_status in ["Stunting", "Underweight", "Overweight"]:
-            developmental_risk = "At Risk"
-        else:
-            developmental_risk = "No Risk"
-        
         return {
             "malnutrition_status": malnutrition_status,
-            "developmental_risk": developmental_risk
+            "developmental_risk": _STATUS_RISK.get(malnutrition_status, "No Risk")
         }
     
     def _get_fallback_recommendation(self, malnutrition_status: str, developmental_risk: str, language: str = "english") -> str:
         """Fallback recommendations based on status with language support."""
-        
-        if language == "swahili":
-            recommendations = {
-                ("Normal", "No Risk"): 
-                    "Mtoto wako anakua vizuri! Endelea kumpa vyakula vya usawa pamoja na matunda, mboga, nafaka, na protini. "
-                    "Tunza nyakati za kawaida za chakula na uhakikishe mazoezi ya kutosha ya kimwili. Tembelea kliniki kwa uchunguzi wa kawaida ili kudumisha ukuaji mzuri.",
-                
-                ("Stunting", "At Risk"):
-                    "Mtoto wako anaonyesha dalili za udogo ambao unaathiri ukuazi wa urefu. Mpe vyakula vyenye protini nyingi kama maharagwe, karanga, mayai, maziwa, na samaki. "
-                    "Jumuisha vyakula vyenye chuma na matunda kwa vitamini. Tafadhali tembelea kliniki haraka kwa ufuatiliaji wa ukuaji na ushauri wa lishe.",
-                
-                ("Stunting", "High Risk"):
-                    "Mtoto wako ana udogo mkubwa unaohitaji umakini wa haraka. Ongeza ulaji wa protini kwa maharagwe, nyama, mayai, na maziwa kila siku. "
-                    "Ongeza vyakula vyenye virutubisho vingi na fikiria programu za kulisha za matibabu. Tembelea kliniki haraka kwa utunzaji maalum na ufuatiliaji.",
-                
-                ("Underweight", "At Risk"):
-                    "Mtoto wako ana uzito mdogo na anahitaji chakula chenye lishe zaidi. Ongeza vyakula vyenye kalori nyingi kama karanga, parachichi, na mafuta ya kupikia katika vyakula. "
-                    "Mpe vyakula vidogo vya mara kwa mara vyenye protini na mafuta mazuri. Tafadhali tembelea kliniki kwa tathmini ya ukuaji na mwongozo wa kulisha.",
-                
-                ("Underweight", "High Risk"):
-                    "Mtoto wako ana upungufu mkubwa wa uzito na anahitaji uingiliaji kazi wa haraka. Ongeza mzunguko wa chakula na ongeza vyakula vya nishati ya juu kila siku. "
-                    "Jumuisha vyakula vya matibabu ikiwa vinapatikana na uhakikishe matibabu ya maambukizi yoyote. Tembelea kituo cha afya haraka kwa utunzaji maalum.",
-                
-                ("Overweight", "At Risk"):
-                    "Mtoto wako ana uzito mkubwa ambao unaweza kuathiri maendeleo mazuri. Punguza vyakula vyenye sukari na ongeza matunda na mboga. "
-                    "Himiza mchezo mkuu na punguza wakati wa kuketi. Tembelea kliniki kwa tathmini sahihi na mwongozo wa tabia za kula nzuri.",
-                
-                ("Overweight", "High Risk"):
-                    "Mtoto wako ana uzito mkubwa unaohitaji usimamizi makini. Zingatia vyakula vyenye lishe, vyenye usawa bila sukari au mafuta mengi. "
-                    "Ongeza mazoezi ya kimwili kupitia mchezo na michezo. Tafadhali tembelea kliniki kwa tathmini ya kina na mpango wa usimamizi wa uzito.",
-                
-                ("Severe", "High Risk"):
-                    "Mtoto wako ana utapiamlo mkubwa unaohitaji umakini wa matibabu wa haraka. Hii ni hali mbaya inayohitaji matibabu ya haraka. "
-                    "Tembelea hospitali au kliniki mara moja kwa huduma za dharura. Fuata ushauri wote wa kimatibabu na itifaki za kulisha za matibabu kwa ukali."
-            }
-        else:
-            recommendations = {
-                ("Normal", "No Risk"): 
-                    "Your child is growing well! Continue providing balanced meals with fruits, vegetables, grains, and proteins. "
-                    "Keep regular meal times and ensure adequate physical activity. Visit the clinic for routine check-ups to maintain healthy growth.",
-                
-                ("Stunting", "At Risk"):
-                    "Your child shows signs of stunting which affects height growth. Provide protein-rich foods like beans, groundnuts, eggs, milk, and fish. "
-                    "Include iron-rich foods and fruits for vitamins. Please visit the clinic immediately for growth monitoring and nutritional counseling.",
-                
-                ("Stunting", "High Risk"):
-                    "Your child has severe stunting requiring urgent attention. Increase protein intake with beans, meat, eggs, and milk daily. "
-                    "Add nutrient-dense foods and consider therapeutic feeding programs. Visit the clinic urgently for specialized care and monitoring.",
-                
-                ("Underweight", "At Risk"):
-                    "Your child is underweight and needs more nutritious food. Add calorie-dense foods like groundnuts, avocados, and cooking oil to meals. "
-                    "Provide frequent small meals with proteins and healthy fats. Please visit the clinic for growth assessment and feeding guidance.",
-                
-                ("Underweight", "High Risk"):
-                    "Your child is severely underweight and needs immediate intervention. Increase meal frequency and add high-energy foods daily. "
-                    "Include therapeutic foods if available and ensure treatment for any infections. Visit the health facility urgently for specialized care.",
-                
-                ("Overweight", "At Risk"):
-                    "Your child is overweight which can affect healthy development. Reduce sugary foods and increase fruits and vegetables. "
-                    "Encourage active play and limit sedentary time. Visit the clinic for proper assessment and guidance on healthy eating habits.",
-                
-                ("Overweight", "High Risk"):
-                    "Your child has significant overweight requiring careful management. Focus on nutritious, balanced meals without excess sugars or fats. "
-                    "Increase physical activity through play and sports. Please visit the clinic for comprehensive evaluation and weight management plan.",
-                
-                ("Severe", "High Risk"):
-                    "Your child has severe malnutrition requiring immediate medical attention. This is a serious condition that needs urgent treatment. "
-                    "Visit the hospital or clinic immediately for emergency care. Follow all medical advice and therapeutic feeding protocols strictly."
-            }
-        
-        key = (malnutrition_status, developmental_risk)
-        default_message = (
-            "Kulingana na hali ya lishe ya mtoto wako, tafadhali mpe vyakula vya usawa vyenye protini, matunda, na mboga. "
-            "Tembelea kliniki ya karibu kwa tathmini sahihi na mwongozo binafsi kuhusu lishe na ukuaji wa mtoto wako."
-        ) if language == "swahili" else (
-            "Based on your child's nutritional status, please provide balanced meals with proteins, fruits, and vegetables. "
-            "Visit your local clinic for proper assessment and personalized guidance on your child's nutrition and growth."
-        )
-        
-        return recommendations.get(key, default_message)
+        lang = "swahili" if language == "swahili" else "english"
+        try:
+            idx = (
+                self._malnutrition_codes[malnutrition_status] * len(self._risk_tbl)
+                + self._risk_codes[developmental_risk]
+            )
+        except KeyError:
+            return _DEFAULT_RECOMMENDATION[lang]
+        return self._rec_table[lang][idx] or _DEFAULT_RECOMMENDATION[lang]
     
-    def _translate_recommendation_to_swahili(self, english_rec: str, malnutrition_status: str, developmental_risk: str) -> str:
-        """Translate English model recommendation to Swahili."""
-        # Use the hardcoded Swahili recommendations as translation
-        return self._get_fallback_recommendation(malnutrition_status, developmental_risk, "swahili")
-
 
 # Global instance
 ml_models = MLModels()
@@ -1,23 +1,42 @@
+import re
 from datetime import datetime
 from typing import Optional
 from uuid import UUID
-from pydantic import BaseModel, EmailStr, Field, ConfigDict
+
+from pydantic import BaseModel, EmailStr, Field, ConfigDict, field_validator
 
 
 # Authentication Schemas
 class UserRegister(BaseModel):
     """Schema for user registration."""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     email: EmailStr = Field(..., description="User email address")
     name: str = Field(..., min_length=1, max_length=255, description="User full name")
     phone: Optional[str] = Field(None, max_length=20, description="User phone number")
     password: str = Field(..., min_length=4, max_length=100, description="User password")
 
 
+# Shape-only email check for login: full EmailStr validation (IDNA and
+# syntax analysis) is wasted on credentials that are matched against the
+# database anyway
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+
 class UserLogin(BaseModel):
     """Schema for user login."""
-    email: EmailStr = Field(..., description="User email address")
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    email: str = Field(..., description="User email address")
     password: str = Field(..., description="User password")
 
+    @field_validator("email")
+    @classmethod
+    def validate_email_shape(cls, v: str) -> str:
+        if not _EMAIL_RE.match(v):
+            raise ValueError("Invalid email address")
+        return v
+
 
 class Token(BaseModel):
     """Schema for authentication token response."""
@@ -28,16 +47,22 @@ class Token(BaseModel):
 
 class TokenRefresh(BaseModel):
     """Schema for token refresh request."""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     refresh_token: str = Field(..., description="Refresh token")
 
 
 class PasswordResetRequest(BaseModel):
     """Schema for password reset request."""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     email: EmailStr = Field(..., description="User email address")
 
 
 class PasswordReset(BaseModel):
     """Schema for password reset."""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     token: str = Field(..., description="Password reset token")
     new_password: str = Field(..., min_length=4, max_length=100, description="New password")
 
@@ -1,7 +1,9 @@
 from datetime import datetime, date
 from typing import Optional, List, Dict, Any, Literal
 from uuid import UUID
-from pydantic import BaseModel, Field, ConfigDict, validator
+from pydantic import BaseModel, Field, ConfigDict, field_validator
+
+from app.core.config import settings
 
 
 class ChildRegister(BaseModel):
@@ -10,8 +12,9 @@ class ChildRegister(BaseModel):
     sex: Literal["Male", "Female"] = Field(..., description="Child's sex")
     birth_date: date = Field(..., description="Child's birth date (YYYY-MM-DD)")
 
-    @validator('birth_date')
-    def validate_birth_date(cls, v):
+    @field_validator('birth_date', mode='after')
+    @classmethod
+    def validate_birth_date(cls, v: date) -> date:
         if v > date.today():
             raise ValueError('Birth date cannot be in the future')
         return v
@@ -19,7 +22,7 @@ class ChildRegister(BaseModel):
 
 class ChildResponse(BaseModel):
     """Schema for child information response."""
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
     
     child_id: UUID
     name: str
@@ -30,6 +33,8 @@ class ChildResponse(BaseModel):
 
 class ChildListResponse(BaseModel):
     """Schema for listing children."""
+    model_config = ConfigDict(frozen=True)
+
     children: List[ChildResponse]
     total_count: int
 
@@ -56,6 +61,8 @@ class GrowthRecordCreate(BaseModel):
 
 class PredictionResult(BaseModel):
     """Schema for prediction results."""
+    model_config = ConfigDict(frozen=True)
+
     malnutrition_status: str
     developmental_risk: str
     confidence_score: Optional[float] = None
@@ -64,7 +71,7 @@ class PredictionResult(BaseModel):
 
 class GrowthRecordResponse(BaseModel):
     """Schema for growth record response with predictions."""
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
     
     record_id: UUID
     child_id: UUID
@@ -82,6 +89,8 @@ class GrowthRecordResponse(BaseModel):
 
 class GrowthPredictionResponse(BaseModel):
     """Schema for growth prediction API response."""
+    model_config = ConfigDict(frozen=True)
+
     malnutrition_status: str = Field(..., description="Predicted malnutrition status")
     developmental_risk: str = Field(..., description="Predicted developmental risk level")
     recommendations: List[str] = Field(..., description="Personalized recommendations")
@@ -91,6 +100,8 @@ class GrowthPredictionResponse(BaseModel):
 
 class ChildGrowthHistory(BaseModel):
     """Schema for child's growth history."""
+    model_config = ConfigDict(frozen=True)
+
     child_info: ChildResponse
     growth_records: List[GrowthRecordResponse]
     total_records: int
@@ -99,7 +110,26 @@ class ChildGrowthHistory(BaseModel):
 
 class GrowthTrend(BaseModel):
     """Schema for growth trend analysis."""
+    model_config = ConfigDict(frozen=True)
+
     child_id: UUID
     measurements: List[Dict[str, Any]]
     trends: Dict[str, str]  # e.g., {"weight": "improving", "height": "stable"}
     alerts: List[str]  # Any concerning patterns
+
+
+# Build every core schema and validator at import time so the first
+# request to an endpoint does not pay the lazy pydantic-core build cost.
+# Outside debug mode the field descriptions only feed /docs, which is
+# disabled, so they are dropped first to keep them out of FieldInfo and
+# the cached OpenAPI schema.
+for _model in (
+    ChildRegister, ChildResponse, ChildListResponse, GrowthRecordCreate,
+    PredictionResult, GrowthRecordResponse, GrowthPredictionResponse,
+    ChildGrowthHistory, GrowthTrend,
+):
+    if not settings.debug:
+        for _field in _model.model_fields.values():
+            _field.description = None
+    _model.model_rebuild(force=True)
+del _model
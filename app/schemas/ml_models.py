@@ -1,6 +1,29 @@
-from pydantic import BaseModel, Field
+from enum import StrEnum
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Literal, Optional
 
+from app.core.config import settings
+
+
+class MalnutritionStatus(StrEnum):
+    """Malnutrition classifications shared across prediction schemas.
+
+    One enum (and therefore one pydantic-core validator) instead of a
+    Literal tuple redeclared per field.
+    """
+    NORMAL = "Normal"
+    OVERWEIGHT = "Overweight"
+    SEVERE = "Severe"
+    STUNTING = "Stunting"
+    UNDERWEIGHT = "Underweight"
+
+
+class DevelopmentalRisk(StrEnum):
+    """Developmental risk levels shared across prediction schemas."""
+    AT_RISK = "At Risk"
+    HIGH_RISK = "High Risk"
+    NO_RISK = "No Risk"
+
 
 class ChatbotRequest(BaseModel):
     """Schema for chatbot question request."""
@@ -10,6 +33,8 @@ class ChatbotRequest(BaseModel):
 
 class ChatbotResponse(BaseModel):
     """Schema for chatbot response."""
+    model_config = ConfigDict(frozen=True)
+
     answer: str = Field(..., description="Detailed answer providing guidance for parents")
 
 
@@ -36,20 +61,22 @@ class PredictionRequest(BaseModel):
 
 class PredictionResponse(BaseModel):
     """Schema for prediction response."""
-    malnutrition_status: Literal["Normal", "Stunting", "Underweight", "Overweight", "Severe"] = Field(
+    model_config = ConfigDict(frozen=True)
+
+    malnutrition_status: MalnutritionStatus = Field(
         ..., description="Malnutrition classification"
     )
-    developmental_risk: Literal["No Risk", "At Risk", "High Risk"] = Field(
+    developmental_risk: DevelopmentalRisk = Field(
         ..., description="Developmental risk assessment"
     )
 
 
 class RecommendationRequest(BaseModel):
     """Schema for recommendation request."""
-    malnutrition_status: Literal["Normal", "Stunting", "Underweight", "Overweight", "Severe"] = Field(
+    malnutrition_status: MalnutritionStatus = Field(
         ..., description="Malnutrition status from prediction"
     )
-    developmental_risk: Literal["No Risk", "At Risk", "High Risk"] = Field(
+    developmental_risk: DevelopmentalRisk = Field(
         ..., description="Developmental risk from prediction"
     )
     language: Optional[Literal["english", "swahili"]] = Field(default="english", description="Response language preference")
@@ -57,6 +84,8 @@ class RecommendationRequest(BaseModel):
 
 class RecommendationResponse(BaseModel):
     """Schema for recommendation response."""
+    model_config = ConfigDict(frozen=True)
+
     recommendation: str = Field(..., description="Detailed nutrition and health recommendation in simple language")
 
 
@@ -67,5 +96,24 @@ class LanguagePreference(BaseModel):
 
 class LanguageResponse(BaseModel):
     """Schema for language preference response."""
+    model_config = ConfigDict(frozen=True)
+
     language: str = Field(..., description="Current language preference")
     message: str = Field(..., description="Confirmation message")
+
+
+# Build every core schema and validator at import time so the first
+# request to an endpoint does not pay the lazy pydantic-core build cost.
+# Outside debug mode the field descriptions only feed /docs, which is
+# disabled, so they are dropped first to keep them out of FieldInfo and
+# the cached OpenAPI schema.
+for _model in (
+    ChatbotRequest, ChatbotResponse, PredictionRequest, PredictionResponse,
+    RecommendationRequest, RecommendationResponse, LanguagePreference,
+    LanguageResponse,
+):
+    if not settings.debug:
+        for _field in _model.model_fields.values():
+            _field.description = None
+    _model.model_rebuild(force=True)
+del _model
@@ -1,73 +1,32 @@
 import pytest
 from httpx import AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy.pool import StaticPool
 
-from app.main import app
-from app.db.database import get_async_session, Base
-from app.core.config import settings
-
-# Test database URL (SQLite for testing)
-TEST_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
-
-# Create test engine
-test_engine = create_async_engine(
-    TEST_DATABASE_URL,
-    connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
-    echo=False
-)
-
-# Test session factory
-test_async_session_maker = async_sessionmaker(
-    test_engine,
-    class_=AsyncSession,
-    expire_on_commit=False
-)
-
-
-async def override_get_async_session():
-    """Override database session for testing."""
-    async with test_async_session_maker() as session:
-        try:
-            yield session
-        except Exception:
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
-
-
-# Override dependency
-app.dependency_overrides[get_async_session] = override_get_async_session
+# Canonical test user shared by the fixtures and tests below
+USER_DATA = {
+    "email": "test@example.com",
+    "name": "Test User",
+    "password": "testpass123"
+}
+LOGIN_DATA = {"email": "test@example.com", "password": "testpass123"}
 
 
 @pytest.fixture
-async def client():
-    """Create test client."""
-    async with AsyncClient(app=app, base_url="http://test") as ac:
-        yield ac
-
+async def tokens(client: AsyncClient, seed_user):
+    """Seed the canonical test user and log in, yielding the tokens.
 
-@pytest.fixture(autouse=True)
-async def setup_database():
-    """Set up test database before each test."""
-    async with test_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    yield
-    async with test_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
+    Function-scoped because the database is wiped between tests. Seeding
+    the row directly reuses the suite-wide precomputed bcrypt hash, so
+    only the login verify is paid per test.
+    """
+    await seed_user(USER_DATA["email"], USER_DATA["name"])
+    response = await client.post("/api/v1/auth/login", json=LOGIN_DATA)
+    return response.json()
 
 
 @pytest.mark.asyncio
 async def test_register_user(client: AsyncClient):
     """Test user registration."""
-    user_data = {
-        "email": "test@example.com",
-        "name": "Test User",
-        "phone": "+1234567890",
-        "password": "testpass123"
-    }
+    user_data = {**USER_DATA, "phone": "+1234567890"}
     
     response = await client.post("/api/v1/auth/register", json=user_data)
     assert response.status_code == 201
@@ -77,22 +36,9 @@ async def test_register_user(client: AsyncClient):
 @pytest.mark.asyncio
 async def test_login_user(client: AsyncClient):
     """Test user login."""
-    # First register a user
-    user_data = {
-        "email": "test@example.com",
-        "name": "Test User",
-        "password": "testpass123"
-    }
-    
-    await client.post("/api/v1/auth/register", json=user_data)
-    
-    # Then login
-    login_data = {
-        "email": "test@example.com",
-        "password": "testpass123"
-    }
-    
-    response = await client.post("/api/v1/auth/login", json=login_data)
+    await client.post("/api/v1/auth/register", json=USER_DATA)
+
+    response = await client.post("/api/v1/auth/login", json=LOGIN_DATA)
     assert response.status_code == 200
     
     data = response.json()
@@ -102,25 +48,8 @@ async def test_login_user(client: AsyncClient):
 
 
 @pytest.mark.asyncio
-async def test_access_protected_endpoint(client: AsyncClient):
+async def test_access_protected_endpoint(client: AsyncClient, tokens: dict):
     """Test accessing protected endpoint with token."""
-    # Register and login first
-    user_data = {
-        "email": "test@example.com",
-        "name": "Test User",
-        "password": "testpass123"
-    }
-    
-    await client.post("/api/v1/auth/register", json=user_data)
-    
-    login_data = {
-        "email": "test@example.com",
-        "password": "testpass123"
-    }
-    
-    login_response = await client.post("/api/v1/auth/login", json=login_data)
-    tokens = login_response.json()
-    
     # Access protected endpoint
     headers = {"Authorization": f"Bearer {tokens['access_token']}"}
     response = await client.get("/api/v1/users/me", headers=headers)
@@ -146,41 +75,18 @@ async def test_invalid_login(client: AsyncClient):
 @pytest.mark.asyncio
 async def test_duplicate_registration(client: AsyncClient):
     """Test registering with duplicate email."""
-    user_data = {
-        "email": "test@example.com",
-        "name": "Test User",
-        "password": "testpass123"
-    }
-    
     # Register first user
-    response1 = await client.post("/api/v1/auth/register", json=user_data)
+    response1 = await client.post("/api/v1/auth/register", json=USER_DATA)
     assert response1.status_code == 201
     
     # Try to register again with same email
-    response2 = await client.post("/api/v1/auth/register", json=user_data)
+    response2 = await client.post("/api/v1/auth/register", json=USER_DATA)
     assert response2.status_code == 400
 
 
 @pytest.mark.asyncio
-async def test_token_refresh(client: AsyncClient):
+async def test_token_refresh(client: AsyncClient, tokens: dict):
     """Test refreshing access token."""
-    # Register and login first
-    user_data = {
-        "email": "test@example.com",
-        "name": "Test User",
-        "password": "testpass123"
-    }
-    
-    await client.post("/api/v1/auth/register", json=user_data)
-    
-    login_data = {
-        "email": "test@example.com",
-        "password": "testpass123"
-    }
-    
-    login_response = await client.post("/api/v1/auth/login", json=login_data)
-    tokens = login_response.json()
-    
     # Refresh token
     refresh_data = {"refresh_token": tokens["refresh_token"]}
     refresh_response = await client.post("/api/v1/auth/refresh", json=refresh_data)
@@ -192,25 +98,8 @@ async def test_token_refresh(client: AsyncClient):
 
 
 @pytest.mark.asyncio
-async def test_logout(client: AsyncClient):
+async def test_logout(client: AsyncClient, tokens: dict):
     """Test user logout."""
-    # Register and login first
-    user_data = {
-        "email": "test@example.com",
-        "name": "Test User",
-        "password": "testpass123"
-    }
-    
-    await client.post("/api/v1/auth/register", json=user_data)
-    
-    login_data = {
-        "email": "test@example.com",
-        "password": "testpass123"
-    }
-    
-    login_response = await client.post("/api/v1/auth/login", json=login_data)
-    tokens = login_response.json()
-    
     # Logout
     headers = {"Authorization": f"Bearer {tokens['access_token']}"}
     logout_response = await client.post("/api/v1/auth/logout", headers=headers)
@@ -224,16 +113,10 @@ async def test_logout(client: AsyncClient):
 
 
 @pytest.mark.asyncio
-async def test_password_reset_request(client: AsyncClient):
+async def test_password_reset_request(client: AsyncClient, seed_user):
     """Test password reset request."""
-    # Register user first
-    user_data = {
-        "email": "test@example.com",
-        "name": "Test User",
-        "password": "testpass123"
-    }
-    
-    await client.post("/api/v1/auth/register", json=user_data)
+    # Seed the user directly (no login needed for a reset request)
+    await seed_user(USER_DATA["email"])
     
     # Request password reset
     reset_data = {"email": "test@example.com"}
@@ -1,84 +1,5 @@
 import pytest
 from httpx import AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy.pool import StaticPool
-
-from app.main import app
-from app.db.database import get_async_session, Base
-
-# Test database URL (SQLite for testing)
-TEST_DATABASE_URL = "sqlite+aiosqlite:///./test_ml.db"
-
-# Create test engine
-test_engine = create_async_engine(
-    TEST_DATABASE_URL,
-    connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
-    echo=False
-)
-
-# Test session factory
-test_async_session_maker = async_sessionmaker(
-    test_engine,
-    class_=AsyncSession,
-    expire_on_commit=False
-)
-
-
-async def override_get_async_session():
-    """Override database session for testing."""
-    async with test_async_session_maker() as session:
-        try:
-            yield session
-        except Exception:
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
-
-
-# Override dependency
-app.dependency_overrides[get_async_session] = override_get_async_session
-
-
-@pytest.fixture
-async def client():
-    """Create test client."""
-    async with AsyncClient(app=app, base_url="http://test") as ac:
-        yield ac
-
-
-@pytest.fixture(autouse=True)
-async def setup_database():
-    """Set up test database before each test."""
-    async with test_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    yield
-    async with test_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-
-
-@pytest.fixture
-async def auth_token(client: AsyncClient):
-    """Get authentication token for testing."""
-    # Register and login to get auth token
-    user_data = {
-        "email": "testuser@example.com",
-        "name": "Test User",
-        "password": "testpass123"
-    }
-    
-    await client.post("/api/v1/auth/register", json=user_data)
-    
-    login_data = {
-        "email": "testuser@example.com",
-        "password": "testpass123"
-    }
-    
-    response = await client.post("/api/v1/auth/login", json=login_data)
-    tokens = response.json()
-    return tokens["access_token"]
-
 
 @pytest.mark.asyncio
 async def test_chatbot_endpoint(client: AsyncClient, auth_token: str):